@@ -7,9 +7,59 @@ Handles PyInstaller build process with proper error handling and validation
 import os
 import sys
 import shutil
+import hashlib
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import argparse
+from importlib import metadata
+
+
+# Directories never worth descending into when sweeping for bytecode caches
+_SKIP_DIRS = {".git", "dist", "build", "venv", ".venv"}
+
+# Files (besides src/**/*.py) whose contents determine the PyInstaller output
+_BUILD_INPUTS = ["main.py", "build.spec", "requirements.txt", "pyproject.toml"]
+# Bundled binaries (build.spec datas), keyed by size and mtime rather than contents
+_BUILD_BINARIES = ["ffmpeg/ffmpeg.exe", "ffmpeg/ffplay.exe", "ffmpeg/ffprobe.exe"]
+# Installed distributions behind build.spec's hiddenimports
+_BUILD_DISTRIBUTIONS = [
+    "customtkinter", "Pillow", "yt-dlp", "packaging", "requests", "tqdm", "psutil"
+]
+_BUILD_CACHE_ROOT = Path.home() / ".cache" / "ytmp3-build"
+
+
+def _scandir_pycache(root, skip_dirs=_SKIP_DIRS):
+    """Yield every __pycache__ directory below root using cached DirEntry metadata"""
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    if entry.name == "__pycache__":
+                        yield entry.path
+                    elif entry.name not in skip_dirs:
+                        stack.append(entry.path)
+        except OSError:
+            continue
+
+
+def _scan_dir(path):
+    """Return {name: DirEntry} for the entries directly inside path, or None if it can't be read"""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except OSError:
+        return None
+
+
+def _list_files(path):
+    """Return the names of regular files directly inside path (empty if missing)"""
+    entries = _scan_dir(path) or {}
+    return {name for name, entry in entries.items() if entry.is_file()}
 
 
 def check_dependencies():
@@ -32,15 +82,15 @@ def check_dependencies():
         print("❌ FFmpeg directory not found")
         return False
     
+    present = _list_files(ffmpeg_dir)
     for binary in required_binaries:
-        binary_path = ffmpeg_dir / binary
-        if not binary_path.exists():
+        if binary not in present:
             print(f"❌ {binary} not found in ffmpeg directory")
             return False
         print(f"✅ {binary} found")
     
     # Check if main.py exists
-    if not Path("main.py").exists():
+    if "main.py" not in _list_files("."):
         print("❌ main.py not found")
         return False
     print("✅ main.py found")
@@ -49,45 +99,149 @@ def check_dependencies():
 
 
 def clean_build():
-    """Clean previous build artifacts"""
+    """Clean previous build artifacts, returning False if build or dist could not be removed"""
     print("🧹 Cleaning previous build artifacts...")
     
     dirs_to_clean = ["build", "dist", "__pycache__"]
-    files_to_clean = ["*.pyc"]
     
-    for dir_name in dirs_to_clean:
-        if Path(dir_name).exists():
-            shutil.rmtree(dir_name)
-            print(f"✅ Removed {dir_name}")
+    # Collect every target first; distinct subtrees can be removed concurrently
+    targets = [dir_name for dir_name in dirs_to_clean if os.path.isdir(dir_name)]
+    targets.extend(
+        path for path in _scandir_pycache(".")
+        if os.path.normpath(path) not in dirs_to_clean
+    )
+    
+    if not targets:
+        return True
     
-    # Clean __pycache__ directories recursively
-    for pycache_dir in Path(".").rglob("__pycache__"):
-        shutil.rmtree(pycache_dir)
-        print(f"✅ Removed {pycache_dir}")
+    success = True
+    with ThreadPoolExecutor(max_workers=min(8, len(targets))) as executor:
+        for target, removed in zip(targets, executor.map(_remove_tree, targets)):
+            if removed:
+                print(f"✅ Removed {target}")
+            else:
+                print(f"❌ Could not remove {target} (is a file in it still in use?)")
+                if target in ("build", "dist"):
+                    success = False
+    return success
+
+
+def _remove_tree(path):
+    """Remove a directory tree, ignoring errors, and return whether it is gone"""
+    shutil.rmtree(path, ignore_errors=True)
+    return not os.path.exists(path)
+
+
+def _iter_source_files(root):
+    """Yield every .py file below root, walking with os.scandir"""
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != "__pycache__":
+                        stack.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    yield entry.path
+
 
+def _build_environment():
+    """Describe the toolchain, bundled binaries and packages that shape the build output"""
+    try:
+        import PyInstaller
+        pyinstaller_version = PyInstaller.__version__
+    except ImportError:
+        pyinstaller_version = "missing"
+    
+    lines = [f"python={sys.version}", f"pyinstaller={pyinstaller_version}"]
+    for name in _BUILD_DISTRIBUTIONS:
+        try:
+            version = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            version = "missing"
+        lines.append(f"{name}={version}")
+    for path in _BUILD_BINARIES:
+        try:
+            st = os.stat(path)
+            lines.append(f"{path}={st.st_size}:{st.st_mtime_ns}")
+        except OSError:
+            lines.append(f"{path}=missing")
+    return "\n".join(lines)
+
+
+def compute_build_hash():
+    """Hash the sources and build environment so identical inputs can reuse a cached dist"""
+    paths = [name for name in _BUILD_INPUTS if os.path.isfile(name)]
+    if os.path.isdir("src"):
+        paths.extend(_iter_source_files("src"))
+    
+    digest = hashlib.sha256()
+    digest.update(_build_environment().encode("utf-8"))
+    digest.update(b"\0")
+    for path in sorted(p.replace(os.sep, "/") for p in paths):
+        digest.update(path.encode("utf-8"))
+        digest.update(b"\0")
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
 
-def build_executable():
-    """Build the executable using PyInstaller"""
+
+def build_executable(use_cache=True):
+    """Build the executable using PyInstaller, reusing a cached dist when sources are unchanged"""
     print("🔨 Building executable...")
     
+    cache_dir = _BUILD_CACHE_ROOT / compute_build_hash() if use_cache else None
+    if cache_dir is not None and cache_dir.is_dir():
+        # Restore into a fresh directory so nothing from an older dist survives
+        staging_dir = Path("dist.restore")
+        try:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            shutil.copytree(cache_dir, staging_dir)
+            if os.path.exists("dist"):
+                shutil.rmtree("dist")
+            os.replace(staging_dir, "dist")
+        except OSError as e:
+            print(f"❌ Could not restore dist from cache: {e}")
+            return False
+        print(f"✅ Sources unchanged, restored dist from cache: {cache_dir}")
+        return True
+    
     try:
-        # Run PyInstaller with the spec file
-        result = subprocess.run([
+        # Run PyInstaller with the spec file, streaming its log as it runs
+        # Keep PyInstaller from leaving bytecode caches behind in the output
+        env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+        with subprocess.Popen([
             sys.executable, "-m", "PyInstaller",
             "--clean",
             "--noconfirm",
             "build.spec"
-        ], check=True, capture_output=True, text=True)
+        ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1, env=env) as proc:
+            for line in proc.stdout:
+                sys.stdout.write(line)
+            returncode = proc.wait()
+        
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, proc.args)
         
         print("✅ Build completed successfully!")
-        print(result.stdout)
+        
+        if cache_dir is not None:
+            staging_dir = cache_dir.with_name(cache_dir.name + ".tmp")
+            try:
+                shutil.rmtree(staging_dir, ignore_errors=True)
+                shutil.copytree("dist", staging_dir,
+                                ignore=shutil.ignore_patterns("__pycache__", "*.pyc"))
+                os.replace(staging_dir, cache_dir)
+                print(f"✅ Cached dist for future builds: {cache_dir}")
+            except OSError as e:
+                print(f"⚠️ Could not cache build output: {e}")
         
         return True
         
     except subprocess.CalledProcessError as e:
-        print("❌ Build failed!")
-        print("STDOUT:", e.stdout)
-        print("STDERR:", e.stderr)
+        print(f"❌ Build failed! PyInstaller exited with code {e.returncode} (see output above)")
         return False
 
 
@@ -95,27 +249,36 @@ def validate_build():
     """Validate the built executable"""
     print("🔍 Validating build...")
     
-    # Check for directory-based distribution first
-    exe_path = Path("dist/youtube-mp3-gui/youtube-mp3-gui.exe")
-    dist_ffmpeg = Path("dist/youtube-mp3-gui/_internal/ffmpeg")
-    
-    # Fallback to single-file distribution
-    if not exe_path.exists():
-        exe_path = Path("dist/youtube-mp3-gui.exe")
-        dist_ffmpeg = Path("dist/ffmpeg")
-    
-    if not exe_path.exists():
+    exe_name = "youtube-mp3-gui.exe"
+    layouts = [
+        # Directory-based distribution first
+        (Path("dist/youtube-mp3-gui"), Path("dist/youtube-mp3-gui/_internal/ffmpeg")),
+        # Fallback to single-file distribution
+        (Path("dist"), Path("dist/ffmpeg")),
+    ]
+    
+    # One directory scan per layout; the DirEntry also supplies the exe size
+    exe_entry = None
+    for app_dir, dist_ffmpeg in layouts:
+        entry = (_scan_dir(app_dir) or {}).get(exe_name)
+        if entry is not None and entry.is_file():
+            exe_entry = entry
+            break
+    
+    if exe_entry is None:
         print("❌ Executable not found in dist directory")
         return False
     
-    print(f"✅ Executable found: {exe_path}")
-    print(f"📦 Size: {exe_path.stat().st_size / (1024*1024):.1f} MB")
+    print(f"✅ Executable found: {exe_entry.path}")
+    print(f"📦 Size: {exe_entry.stat().st_size / (1024*1024):.1f} MB")
     
     # Check if FFmpeg binaries are included
-    if dist_ffmpeg.exists():
+    ffmpeg_entries = _scan_dir(dist_ffmpeg)
+    if ffmpeg_entries is not None:
         print("✅ FFmpeg directory found in dist")
         for binary in ["ffmpeg.exe", "ffplay.exe", "ffprobe.exe"]:
-            if (dist_ffmpeg / binary).exists():
+            entry = ffmpeg_entries.get(binary)
+            if entry is not None and entry.is_file():
                 print(f"✅ {binary} included")
             else:
                 print(f"❌ {binary} missing")
@@ -142,13 +305,20 @@ def create_distribution():
         print("❌ Dist directory not found")
         return False
     
+    # Strip bytecode caches from the frozen tree; they only inflate the package
+    pycache_dirs = list(_scandir_pycache(dist_dir, skip_dirs=()))
+    for pycache_dir in pycache_dirs:
+        shutil.rmtree(pycache_dir, ignore_errors=True)
+    if pycache_dirs:
+        print(f"✅ Removed {len(pycache_dirs)} __pycache__ directories from dist")
+    
     # Create downloads directory in dist
     downloads_dir = dist_dir / "downloads"
     downloads_dir.mkdir(exist_ok=True)
     print("✅ Created downloads directory")
     
     # Copy README if it exists
-    if Path("README.md").exists():
+    if "README.md" in _list_files("."):
         shutil.copy2("README.md", dist_dir / "README.txt")
         print("✅ Copied README")
     
@@ -190,6 +360,7 @@ def main():
     parser.add_argument("--clean-only", action="store_true", help="Only clean build artifacts")
     parser.add_argument("--no-clean", action="store_true", help="Skip cleaning step")
     parser.add_argument("--validate-only", action="store_true", help="Only validate existing build")
+    parser.add_argument("--no-cache", action="store_true", help="Always run PyInstaller, ignoring cached builds")
     
     args = parser.parse_args()
     
@@ -197,7 +368,8 @@ def main():
     print("=" * 50)
     
     if args.clean_only:
-        clean_build()
+        if not clean_build():
+            sys.exit(1)
         return
     
     if args.validate_only:
@@ -213,10 +385,11 @@ def main():
         print("❌ Dependency check failed!")
         sys.exit(1)
     
-    if not args.no_clean:
-        clean_build()
+    if not args.no_clean and not clean_build():
+        print("❌ Build process failed!")
+        sys.exit(1)
     
-    if not build_executable():
+    if not build_executable(use_cache=not args.no_cache):
         print("❌ Build process failed!")
         sys.exit(1)
     
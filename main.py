@@ -8,8 +8,13 @@ and resource management.
 """
 import sys
 import os
+import atexit
+import queue
+import tempfile
 import logging
+import logging.handlers
 import traceback
+import importlib.util
 from pathlib import Path
 from typing import Optional
 
@@ -17,9 +22,9 @@ from typing import Optional
 src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path))
 
+# Only the lightweight exceptions module is imported up front; the GUI and
+# FFmpeg service are imported where they are first needed.
 try:
-    from src.main_window import MainWindow
-    from src.ffmpeg_service import FFmpegService
     from src.exceptions import FFmpegNotFoundError, DownloadError
 except ImportError as e:
     print(f"✗ Error importing modules: {e}")
@@ -29,26 +34,65 @@ except ImportError as e:
     sys.exit(1)
 
 
+_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+_DEBUG_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
+
+
 def setup_logging() -> logging.Logger:
     """
     Set up comprehensive logging configuration for the application.
     
+    File output is handed off to a background QueueListener so logging calls
+    from the GUI and download threads only enqueue the record.
+    
     Returns:
         logging.Logger: Configured logger instance
     """
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
     
+    # Log files are opened on the first record they accept, not up front
+    
+    # General application log
+    file_handler = logging.FileHandler(
+        log_dir / "youtube_mp3_gui.log",
+        mode='a',
+        encoding='utf-8',
+        delay=True
+    )
+    file_handler.setLevel(logging.INFO)
+    file_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+    
+    # Debug file handler for detailed application logging
+    debug_handler = logging.FileHandler(
+        log_dir / "debug.log",
+        mode='a',
+        encoding='utf-8',
+        delay=True
+    )
+    debug_handler.setLevel(logging.DEBUG)
+    debug_handler.addFilter(logging.Filter('youtube_mp3_gui'))
+    debug_handler.setFormatter(logging.Formatter(_DEBUG_LOG_FORMAT))
+    
+    # File writes happen on the listener thread
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, debug_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    
+    # The listener's handlers apply the real formats; the queue handler only
+    # merges args and tracebacks into the message
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    
     # Configure root logger
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        format=_LOG_FORMAT,
         handlers=[
-            logging.FileHandler(
-                log_dir / "youtube_mp3_gui.log",
-                mode='a',
-                encoding='utf-8'
-            ),
+            queue_handler,
             logging.StreamHandler(sys.stdout)
         ]
     )
@@ -57,19 +101,6 @@ def setup_logging() -> logging.Logger:
     logger = logging.getLogger('youtube_mp3_gui')
     logger.setLevel(logging.DEBUG)
     
-    # Add debug file handler for detailed logging
-    debug_handler = logging.FileHandler(
-        log_dir / "debug.log",
-        mode='a',
-        encoding='utf-8'
-    )
-    debug_handler.setLevel(logging.DEBUG)
-    debug_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
-    )
-    debug_handler.setFormatter(debug_formatter)
-    logger.addHandler(debug_handler)
-    
     return logger
 
 
@@ -94,20 +125,27 @@ def check_dependencies(logger: logging.Logger) -> bool:
     
     missing_packages = []
     
+    # Locate packages without executing them; the real imports happen
+    # when the main window is constructed.
     for package_name, description in required_packages:
         try:
-            __import__(package_name)
+            spec = importlib.util.find_spec(package_name)
+        except (ImportError, ValueError) as e:
+            spec = None
+            logger.error("Failed to locate %s: %s", package_name, e)
+        
+        if spec is not None:
             print(f"✓ {description} available")
-            logger.debug(f"Package {package_name} imported successfully")
-        except ImportError as e:
+            logger.debug("Package %s found", package_name)
+        else:
             print(f"✗ Missing {description}: {package_name}")
             missing_packages.append(package_name)
-            logger.error(f"Failed to import {package_name}: {e}")
+            logger.error("Package %s not found", package_name)
     
     if missing_packages:
         print(f"\nMissing packages: {', '.join(missing_packages)}")
         print("Please install required packages using: pip install -r requirements.txt")
-        logger.error(f"Missing required packages: {missing_packages}")
+        logger.error("Missing required packages: %s", missing_packages)
         return False
     
     print("✓ All required Python packages are available")
@@ -115,10 +153,11 @@ def check_dependencies(logger: logging.Logger) -> bool:
     
     # Check FFmpeg availability (Requirements 4.1, 4.2, 4.3)
     try:
+        from src.ffmpeg_service import FFmpegService
         ffmpeg_available, ffmpeg_path = FFmpegService.check_availability()
         if ffmpeg_available:
             print(f"✓ FFmpeg found at: {ffmpeg_path}")
-            logger.info(f"FFmpeg available at: {ffmpeg_path}")
+            logger.info("FFmpeg available at: %s", ffmpeg_path)
         else:
             print("⚠ FFmpeg not found. The application may not work properly.")
             print("Please ensure FFmpeg is available in the 'ffmpeg' folder or system PATH.")
@@ -130,13 +169,27 @@ def check_dependencies(logger: logging.Logger) -> bool:
             
     except Exception as e:
         print(f"✗ Error checking FFmpeg: {e}")
-        logger.error(f"Error during FFmpeg check: {e}", exc_info=True)
+        logger.error("Error during FFmpeg check: %s", e, exc_info=True)
         return False
     
     logger.info("Dependency check completed successfully")
     return True
 
 
+def _is_writable(dir_path: Path) -> bool:
+    """
+    Check whether files can actually be created in a directory.
+    
+    os.access(W_OK) only inspects the read-only attribute on Windows and
+    ignores ACLs, so a real temporary file is created instead.
+    """
+    try:
+        with tempfile.NamedTemporaryFile(dir=dir_path, prefix='.wtest'):
+            return True
+    except OSError:
+        return False
+
+
 def setup_directories(logger: logging.Logger) -> bool:
     """
     Create necessary directories for the application.
@@ -160,33 +213,47 @@ def setup_directories(logger: logging.Logger) -> bool:
             dir_path = Path(directory)
             
             # Create directory if it doesn't exist
-            if not dir_path.exists():
-                dir_path.mkdir(exist_ok=True)
-                print(f"✓ Created directory '{directory}' ({description})")
-                logger.info(f"Created directory: {directory}")
-            else:
+            try:
+                dir_path.mkdir()
+            except FileExistsError:
                 print(f"✓ Directory '{directory}' ready")
-                logger.debug(f"Directory already exists: {directory}")
-            
-            # Check if directory is writable
-            if not os.access(dir_path, os.W_OK):
-                print(f"✗ Directory '{directory}' is not writable")
-                logger.error(f"Directory not writable: {directory}")
-                return False
+                logger.debug("Directory already exists: %s", directory)
+                
+                # A directory we just created is writable by definition;
+                # only pre-existing ones need probing
+                if not _is_writable(dir_path):
+                    print(f"✗ Directory '{directory}' is not writable")
+                    logger.error("Directory not writable: %s", directory)
+                    return False
+            else:
+                print(f"✓ Created directory '{directory}' ({description})")
+                logger.info("Created directory: %s", directory)
                 
     except PermissionError as e:
         print(f"✗ Permission error creating directories: {e}")
-        logger.error(f"Permission error during directory setup: {e}")
+        logger.error("Permission error during directory setup: %s", e)
         return False
     except Exception as e:
         print(f"✗ Error setting up directories: {e}")
-        logger.error(f"Unexpected error during directory setup: {e}", exc_info=True)
+        logger.error("Unexpected error during directory setup: %s", e, exc_info=True)
         return False
     
     logger.info("Directory setup completed successfully")
     return True
 
 
+def _has_display() -> bool:
+    """
+    Cheaply check whether a GUI dialog could be shown at all.
+    
+    On X11/Wayland systems without a display server, constructing a Tk root
+    is slow and then fails, so the crash handler skips it.
+    """
+    if sys.platform in ('win32', 'darwin'):
+        return True
+    return bool(os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
+
+
 def handle_uncaught_exception(exc_type, exc_value, exc_traceback):
     """
     Handle uncaught exceptions by logging them and showing user-friendly messages.
@@ -215,24 +282,26 @@ def handle_uncaught_exception(exc_type, exc_value, exc_traceback):
     print("Please check the log files for detailed information.")
     print("Log location: logs/youtube_mp3_gui.log")
     
-    # Try to show GUI error dialog if possible
-    try:
-        import tkinter as tk
-        from tkinter import messagebox
-        
-        root = tk.Tk()
-        root.withdraw()  # Hide the root window
-        
-        messagebox.showerror(
-            "Critical Error",
-            f"An unexpected error occurred:\n\n{exc_value}\n\n"
-            "Please check the log files for more details.\n"
-            "Log location: logs/youtube_mp3_gui.log"
-        )
-        root.destroy()
-    except:
-        # If GUI error dialog fails, just continue
-        pass
+    # Show a GUI error dialog when there is a display; otherwise the
+    # console message above is all the user gets
+    if _has_display():
+        try:
+            import tkinter as tk
+            from tkinter import messagebox
+            
+            root = tk.Tk()
+            root.withdraw()  # Hide the root window
+            
+            messagebox.showerror(
+                "Critical Error",
+                f"An unexpected error occurred:\n\n{exc_value}\n\n"
+                "Please check the log files for more details.\n"
+                "Log location: logs/youtube_mp3_gui.log"
+            )
+            root.destroy()
+        except:
+            # If GUI error dialog fails, just continue
+            pass
     
     input("Press Enter to exit...")
     sys.exit(1)
@@ -264,16 +333,17 @@ def initialize_resources(logger: logging.Logger) -> bool:
     
     # Verify FFmpeg functionality (Requirements 4.1, 4.2, 4.3)
     try:
+        from src.ffmpeg_service import FFmpegService
         ffmpeg_path = FFmpegService.get_ffmpeg_path()
-        logger.info(f"FFmpeg verified and ready at: {ffmpeg_path}")
+        logger.info("FFmpeg verified and ready at: %s", ffmpeg_path)
         print(f"✓ FFmpeg verified and ready")
     except FFmpegNotFoundError as e:
         print(f"⚠ Warning: {e}")
-        logger.warning(f"FFmpeg not available: {e}")
+        logger.warning("FFmpeg not available: %s", e)
         print("The application will start but downloads may fail without FFmpeg.")
     except Exception as e:
         print(f"✗ Error verifying FFmpeg: {e}")
-        logger.error(f"FFmpeg verification failed: {e}", exc_info=True)
+        logger.error("FFmpeg verification failed: %s", e, exc_info=True)
         return False
     
     logger.info("Resource initialization completed successfully")
@@ -300,12 +370,13 @@ def main():
     try:
         # Set up logging first
         logger = setup_logging()
-        logger.info("=" * 50)
-        logger.info("YouTube MP3 GUI Downloader starting")
-        logger.info(f"Python version: {sys.version}")
-        logger.info(f"Platform: {sys.platform}")
-        logger.info(f"Working directory: {os.getcwd()}")
-        logger.info("=" * 50)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("=" * 50)
+            logger.info("YouTube MP3 GUI Downloader starting")
+            logger.info("Python version: %s", sys.version)
+            logger.info("Platform: %s", sys.platform)
+            logger.info("Working directory: %s", os.getcwd())
+            logger.info("=" * 50)
         
         # Install global exception handler
         sys.excepthook = handle_uncaught_exception
@@ -320,6 +391,7 @@ def main():
         logger.info("Launching main application window")
         
         # Create and run the main application
+        from src.main_window import MainWindow
         app = MainWindow()
         logger.info("MainWindow created successfully")
         
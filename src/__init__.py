@@ -1,10 +1,8 @@
 """
 YouTube MP3 GUI Downloader - Core modules
 """
+import importlib
 
-from .youtube_downloader import YouTubeDownloader
-from .ffmpeg_service import FFmpegService
-from .url_validator import URLValidator
 from .exceptions import (
     DownloadError,
     FFmpegNotFoundError,
@@ -14,6 +12,24 @@ from .exceptions import (
     ConversionError
 )
 
+# Service classes are imported on first access so that importing the package
+# (e.g. just for its exceptions) doesn't pull in yt_dlp or requests.
+_LAZY_IMPORTS = {
+    'YouTubeDownloader': '.youtube_downloader',
+    'FFmpegService': '.ffmpeg_service',
+    'URLValidator': '.url_validator',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     'YouTubeDownloader',
     'FFmpegService',
@@ -3,13 +3,39 @@ Configuration management for YouTube MP3 GUI Downloader.
 """
 import json
 import os
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+# Optional orjson import for faster config parsing/serialisation
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+def _loads(data: bytes) -> Dict[str, Any]:
+    """Parse JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(config: Dict[str, Any]) -> bytes:
+    """Serialise the config to indented UTF-8 JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(config, indent=2, ensure_ascii=False).encode('utf-8')
+
 
 class ConfigManager:
     """Manages application configuration and settings."""
     
+    # Delay used to coalesce bursts of update_settings() calls into one write
+    SAVE_DEBOUNCE_SECONDS = 0.5
+    
     DEFAULT_CONFIG = {
         "download_folder": "downloads",
         "audio_quality": "192",
@@ -26,33 +52,82 @@ class ConfigManager:
         """Initialize the configuration manager."""
         self.config_file = Path(config_file)
         self._config = self.DEFAULT_CONFIG.copy()
+        self._save_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+        self._dirty = False
+        self._download_folder: Optional[str] = None
         self.load_config()
     
     def load_config(self) -> None:
         """Load configuration from file, creating default if it doesn't exist."""
         try:
             if self.config_file.exists():
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    loaded_config = json.load(f)
-                    # Update default config with loaded values
-                    self._config.update(loaded_config)
+                loaded_config = _loads(self.config_file.read_bytes())
+                # Update default config with loaded values
+                self._config.update(loaded_config)
             else:
                 # Create default config file
                 self.save_config()
         except (json.JSONDecodeError, IOError) as e:
             print(f"Error loading config file: {e}. Using default configuration.")
             self._config = self.DEFAULT_CONFIG.copy()
+        
+        self._rebuild_cache()
+    
+    def _rebuild_cache(self) -> None:
+        """Recompute the values served by the typed getters from the raw config."""
+        config = self._config
+        download_folder = config.get("download_folder", "downloads")
+        self._audio_quality = config.get("audio_quality", "192")
+        self._audio_format = config.get("audio_format", "mp3")
+        self._theme = config.get("theme", "dark")
+        self._window_size = (config.get("window_width", 800), config.get("window_height", 600))
+        self._max_concurrent = config.get("max_concurrent_downloads", 3)
+        self._auto_scroll = config.get("auto_scroll_logs", True)
+        
+        # Ensure the download folder exists, only when it actually changed
+        if download_folder != self._download_folder:
+            Path(download_folder).mkdir(parents=True, exist_ok=True)
+            self._download_folder = download_folder
     
     def save_config(self) -> None:
-        """Save current configuration to file."""
-        try:
-            # Ensure the directory exists
-            self.config_file.parent.mkdir(parents=True, exist_ok=True)
+        """
+        Save current configuration to file.
+        
+        The data is written to a temporary file and moved into place with
+        os.replace, so a crash mid-write never leaves a truncated config.
+        """
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            self._dirty = False
             
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self._config, f, indent=2, ensure_ascii=False)
-        except IOError as e:
-            print(f"Error saving config file: {e}")
+            tmp_file = self.config_file.with_suffix('.json.tmp')
+            try:
+                # Ensure the directory exists
+                self.config_file.parent.mkdir(parents=True, exist_ok=True)
+                
+                data = _dumps(self._config)
+                with open(tmp_file, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_file, self.config_file)
+            except IOError as e:
+                print(f"Error saving config file: {e}")
+    
+    def flush(self) -> None:
+        """Write any pending debounced changes to disk immediately."""
+        if self._dirty:
+            self.save_config()
+    
+    def _schedule_save(self) -> None:
+        """Mark the config dirty and (re)start the debounced save timer."""
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self.SAVE_DEBOUNCE_SECONDS, self.flush)
+            self._save_timer.start()
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value."""
@@ -61,21 +136,19 @@ class ConfigManager:
     def set(self, key: str, value: Any) -> None:
         """Set a configuration value."""
         self._config[key] = value
+        self._rebuild_cache()
     
     def get_download_folder(self) -> str:
         """Get the download folder path."""
-        folder = self._config.get("download_folder", "downloads")
-        # Ensure the folder exists
-        Path(folder).mkdir(parents=True, exist_ok=True)
-        return folder
+        return self._download_folder
     
     def get_audio_quality(self) -> str:
         """Get the audio quality setting."""
-        return self._config.get("audio_quality", "192")
+        return self._audio_quality
     
     def get_audio_format(self) -> str:
         """Get the audio format setting."""
-        return self._config.get("audio_format", "mp3")
+        return self._audio_format
     
     def get_ffmpeg_path(self) -> str:
         """Get the FFmpeg path, checking local and system paths."""
@@ -94,32 +167,32 @@ class ConfigManager:
     
     def get_theme(self) -> str:
         """Get the UI theme setting."""
-        return self._config.get("theme", "dark")
+        return self._theme
     
     def get_window_size(self) -> tuple[int, int]:
         """Get the window size settings."""
-        width = self._config.get("window_width", 800)
-        height = self._config.get("window_height", 600)
-        return width, height
+        return self._window_size
     
     def get_max_concurrent_downloads(self) -> int:
         """Get the maximum number of concurrent downloads."""
-        return self._config.get("max_concurrent_downloads", 3)
+        return self._max_concurrent
     
     def is_auto_scroll_enabled(self) -> bool:
         """Check if auto-scroll for logs is enabled."""
-        return self._config.get("auto_scroll_logs", True)
+        return self._auto_scroll
     
     def update_settings(self, settings: Dict[str, Any]) -> None:
-        """Update multiple settings at once."""
+        """Update multiple settings at once (saved after a short debounce; see flush())."""
         for key, value in settings.items():
             if key in self.DEFAULT_CONFIG:
                 self._config[key] = value
-        self.save_config()
+        self._rebuild_cache()
+        self._schedule_save()
     
     def reset_to_defaults(self) -> None:
         """Reset configuration to default values."""
         self._config = self.DEFAULT_CONFIG.copy()
+        self._rebuild_cache()
         self.save_config()
     
     def get_all_settings(self) -> Dict[str, Any]:
@@ -1,11 +1,15 @@
 """
 Download Manager for coordinating multiple YouTube downloads with threading support.
 """
+import hashlib
 import threading
 import time
-from typing import List, Callable, Optional, Dict, Any
-from queue import Queue, Empty
-from concurrent.futures import ThreadPoolExecutor, Future, as_completed
+from collections import deque
+from functools import partial
+from itertools import chain
+from typing import List, Callable, Optional, Dict, Any, Tuple
+from queue import Queue, Full
+from concurrent.futures import ThreadPoolExecutor, Future, FIRST_COMPLETED, wait
 
 from .models import DownloadTask, DownloadStatus
 from .youtube_downloader import YouTubeDownloader
@@ -15,6 +19,141 @@ from .progress_throttler import ProgressThrottler
 from .performance_monitor import record_progress_callback
 
 
+# Stats bucket each status is counted under in get_overall_progress()
+_STATUS_BUCKETS = {
+    DownloadStatus.PENDING: 'pending',
+    DownloadStatus.DOWNLOADING: 'active',
+    DownloadStatus.CONVERTING: 'active',
+    DownloadStatus.COMPLETED: 'completed',
+    DownloadStatus.FAILED: 'failed',
+    DownloadStatus.CANCELLED: 'cancelled',
+}
+
+
+# Status strings carried in progress events, and the enum -> string map used
+# on the hot path instead of going through Enum.value on every event
+_STATUS_DOWNLOADING = DownloadStatus.DOWNLOADING.value
+_STATUS_CONVERTING = DownloadStatus.CONVERTING.value
+_STATUS_COMPLETED = DownloadStatus.COMPLETED.value
+_STATUS_FAILED = DownloadStatus.FAILED.value
+_STATUS_CANCELLED = DownloadStatus.CANCELLED.value
+_STATUS_VALUES = {status: status.value for status in DownloadStatus}
+
+
+# Progress events that must reach the UI even when the dispatch queue is full
+_MUST_DELIVER_STATUSES = frozenset({
+    _STATUS_CONVERTING, _STATUS_COMPLETED, _STATUS_FAILED, _STATUS_CANCELLED
+})
+
+
+# Adaptive throttling: the per-task UI update interval scales with download
+# speed so fast streams fire less often and slow ones stay responsive
+_MIN_PROGRESS_INTERVAL = 0.05
+_MAX_PROGRESS_INTERVAL = 0.5
+_INTERVAL_BYTES_PER_SECOND = 20_000_000  # Speed at which the max interval applies
+
+
+def _progress_interval(bytes_per_sec: float) -> float:
+    """UI update interval in seconds for a download running at the given speed."""
+    interval = bytes_per_sec / _INTERVAL_BYTES_PER_SECOND * _MAX_PROGRESS_INTERVAL
+    # Rounded so small speed jitter doesn't retune the throttler every tick
+    return round(max(_MIN_PROGRESS_INTERVAL, min(_MAX_PROGRESS_INTERVAL, interval)), 2)
+
+
+def _progress_contribution(status: DownloadStatus, progress: float) -> float:
+    """Amount a task in the given state adds to the overall progress sum."""
+    if status == DownloadStatus.COMPLETED:
+        return 100.0
+    if status == DownloadStatus.DOWNLOADING or status == DownloadStatus.CONVERTING:
+        return progress
+    return 0.0
+
+
+class _TaskProgressHandler:
+    """Progress callback for a single task, passed to YouTubeDownloader."""
+    
+    __slots__ = ('manager', 'task_id', 'task', 'interval')
+    
+    def __init__(self, manager: 'DownloadManager', task_id: str, task: DownloadTask):
+        self.manager = manager
+        self.task_id = task_id
+        self.task = task
+        self.interval: Optional[float] = None
+    
+    def __call__(self, progress_data: Dict[str, Any]) -> None:
+        manager = self.manager
+        if manager._cancel_event.is_set():
+            return
+        
+        task = self.task
+        status = progress_data.get('status')
+        
+        # Update task progress based on status
+        if status == _STATUS_DOWNLOADING:
+            # Calculate progress from bytes
+            downloaded = progress_data.get('downloaded_bytes', 0)
+            total = progress_data.get('total_bytes', 0)
+            if total > 0:
+                progress = (downloaded / total) * 80.0  # 80% for download
+            else:
+                progress = 0.0
+            
+            task.update_progress(progress)
+            
+            # Retune this task's throttle interval to the current speed
+            speed = progress_data.get('speed')
+            if speed:
+                interval = _progress_interval(speed)
+                if interval != self.interval:
+                    self.interval = interval
+                    manager._progress_throttler.set_interval(self.task_id, interval)
+            
+        elif status == _STATUS_CONVERTING:
+            task.set_status(DownloadStatus.CONVERTING)
+            task.update_progress(90.0)  # 90% when converting
+            
+        elif status == _STATUS_COMPLETED:
+            task.set_status(DownloadStatus.COMPLETED)
+            task.update_progress(100.0)
+        
+        # Notify UI; upstream keys take precedence, as before. A fresh dict
+        # per event, since the throttler keeps it without copying
+        data = {
+            'status': _STATUS_VALUES[task.status],
+            'progress': task.progress,
+            'url': task.url,
+            'title': task.title,
+        }
+        data.update(progress_data)
+        manager._notify_progress(self.task_id, data)
+
+
+class _TaskLogHandler:
+    """Log callback for a single task that prefixes messages with its ID."""
+    
+    __slots__ = ('manager', 'prefix')
+    
+    def __init__(self, manager: 'DownloadManager', task_id: str):
+        self.manager = manager
+        self.prefix = f"[{task_id}] "
+    
+    def __call__(self, message: str) -> None:
+        log_callback = self.manager.log_callback
+        if log_callback:
+            log_callback(self.prefix + message)
+
+
+class _SubmitSession:
+    """Per-session state shared between _run_downloads and the submitter thread."""
+    
+    __slots__ = ('executor', 'futures', 'done')
+    
+    def __init__(self, executor: ThreadPoolExecutor):
+        self.executor = executor
+        self.futures: Dict[Future, Tuple[str, DownloadTask]] = {}
+        self.done = threading.Event()
+
+
 class DownloadManager:
     """
     Manages multiple download tasks with threading support and progress callbacks.
@@ -52,11 +191,34 @@ class DownloadManager:
         self.is_downloading = False
         self.is_cancelled = False
         
-        # Threading components
+        # Threading components; the worker pool persists across download
+        # sessions and is only rebuilt after a cancel shuts it down
         self._executor: Optional[ThreadPoolExecutor] = None
-        self._futures: Dict[str, Future] = {}
+        self._futures: List[Future] = []
         self._cancel_event = threading.Event()
         self._lock = threading.Lock()
+        self._get_executor()
+        
+        # Bounded FIFO drained by a dedicated submitter thread; back-pressure
+        # blocks only the feeding thread, never the workers
+        self._submit_queue: Queue = Queue(maxsize=max_concurrent_downloads * 32)
+        self._submitter_thread = threading.Thread(
+            target=self._submit_loop, name="dlmgr-submitter", daemon=True
+        )
+        self._submitter_thread.start()
+        
+        # Incrementally maintained stats, updated on task state changes so
+        # get_overall_progress() doesn't rescan every task
+        self._stats_lock = threading.Lock()
+        self._bucket_counts: Dict[str, int] = {
+            'completed': 0,
+            'failed': 0,
+            'cancelled': 0,
+            'active': 0,
+            'pending': 0
+        }
+        self._progress_sum = 0.0
+        self._accounted: Dict[str, Tuple[str, float]] = {}
         
         # Progress throttling for performance optimization
         self._progress_throttler = ProgressThrottler(
@@ -66,6 +228,16 @@ class DownloadManager:
         )
         self._progress_throttler.set_callback(self._throttled_progress_callback)
         
+        # Bounded hand-off to a single UI dispatch thread (see _dispatch_loop)
+        self._dispatch_queue: Queue = Queue(maxsize=64)
+        # Must-deliver updates that found the queue full. While it holds
+        # anything, later updates go here too so per-task order is kept
+        self._dispatch_overflow: deque = deque()
+        self._dispatch_thread = threading.Thread(
+            target=self._dispatch_loop, name="dlmgr-ui-dispatch", daemon=True
+        )
+        self._dispatch_thread.start()
+        
         # YouTube downloader instance
         self._downloader = YouTubeDownloader(download_folder=download_folder)
     
@@ -86,29 +258,26 @@ class DownloadManager:
             raise URLValidationError("No URLs provided")
         
         # Extract and validate URLs
-        all_urls = []
-        for url_text in urls:
-            extracted = URLValidator.extract_urls_from_text(url_text)
-            all_urls.extend(extracted)
+        all_urls = list(chain.from_iterable(
+            URLValidator.extract_urls_from_text(url_text) for url_text in urls
+        ))
         
         if not all_urls:
             raise URLValidationError("No valid YouTube URLs found")
         
         # Remove duplicates while preserving order
-        unique_urls = []
-        seen = set()
-        for url in all_urls:
-            if url not in seen:
-                seen.add(url)
-                unique_urls.append(url)
-        
-        # Create download tasks
+        unique_urls = list(dict.fromkeys(all_urls))
+        
+        # Create download tasks; one timestamp serves the whole batch
+        timestamp = str(int(time.time()))
         task_ids = []
         with self._lock:
             for url in unique_urls:
-                task_id = self._generate_task_id(url)
+                task_id = self._generate_task_id(url, timestamp)
                 task = DownloadTask(url=url)
+                task.on_change = partial(self._on_task_changed, task_id)
                 self.tasks[task_id] = task
+                self._on_task_changed(task_id, task)
                 task_ids.append(task_id)
         
         if self.log_callback:
@@ -166,14 +335,17 @@ class DownloadManager:
             self.log_callback("Canceling downloads...")
         
         # Cancel all running futures
-        for future in self._futures.values():
+        with self._lock:
+            futures = list(self._futures)
+        for future in futures:
             future.cancel()
         
         # Update task statuses
         with self._lock:
-            for task in self.tasks.values():
-                if task.is_active():
-                    task.set_status(DownloadStatus.CANCELLED)
+            tasks = list(self.tasks.items())
+        for task_id, task in tasks:
+            if task.is_active():
+                self._mark_cancelled(task_id, task)
         
         # Cleanup resources
         self._cleanup_resources()
@@ -182,49 +354,19 @@ class DownloadManager:
         """
         Get overall download progress information.
         
+        Counters are maintained incrementally as tasks change state, so this
+        is O(1) regardless of the number of tasks.
+        
         Returns:
             Dict containing progress statistics
         """
-        with self._lock:
-            if not self.tasks:
-                return {
-                    'total_tasks': 0,
-                    'completed': 0,
-                    'failed': 0,
-                    'cancelled': 0,
-                    'active': 0,
-                    'pending': 0,
-                    'overall_progress': 0.0
-                }
-            
-            stats = {
-                'total_tasks': len(self.tasks),
-                'completed': 0,
-                'failed': 0,
-                'cancelled': 0,
-                'active': 0,
-                'pending': 0
-            }
-            
-            total_progress = 0.0
-            
-            for task in self.tasks.values():
-                if task.is_completed():
-                    stats['completed'] += 1
-                    total_progress += 100.0
-                elif task.is_failed():
-                    stats['failed'] += 1
-                elif task.is_cancelled():
-                    stats['cancelled'] += 1
-                elif task.is_active():
-                    stats['active'] += 1
-                    total_progress += task.progress
-                else:  # pending
-                    stats['pending'] += 1
-            
-            stats['overall_progress'] = total_progress / len(self.tasks) if self.tasks else 0.0
-            
-            return stats
+        with self._stats_lock:
+            total_tasks = len(self._accounted)
+            stats = {'total_tasks': total_tasks}
+            stats.update(self._bucket_counts)
+            stats['overall_progress'] = self._progress_sum / total_tasks if total_tasks else 0.0
+        
+        return stats
     
     def get_task_status(self, task_id: str) -> Optional[DownloadTask]:
         """
@@ -236,8 +378,21 @@ class DownloadManager:
         Returns:
             DownloadTask if found, None otherwise
         """
-        with self._lock:
-            return self.tasks.get(task_id)
+        # A single dict lookup is atomic; no lock needed
+        return self.tasks.get(task_id)
+    
+    def get_tasks_status(self, task_ids: List[str]) -> List[DownloadTask]:
+        """
+        Get several tasks at once, skipping IDs that are unknown.
+        
+        Args:
+            task_ids: IDs of the tasks to fetch
+            
+        Returns:
+            List[DownloadTask]: Tasks found, in the order of task_ids
+        """
+        tasks = self.tasks  # One snapshot of the dict for the whole batch
+        return [task for task in map(tasks.get, task_ids) if task is not None]
     
     def clear_completed_tasks(self) -> int:
         """
@@ -250,56 +405,153 @@ class DownloadManager:
             if self.is_downloading:
                 return 0  # Don't clear while downloading
             
-            completed_tasks = [
-                task_id for task_id, task in self.tasks.items()
-                if task.is_completed() or task.is_failed() or task.is_cancelled()
-            ]
+            # Rebuild the dict in one pass instead of deleting key by key
+            old_tasks = self.tasks
+            self.tasks = {
+                task_id: task for task_id, task in old_tasks.items()
+                if not (task.is_completed() or task.is_failed() or task.is_cancelled())
+            }
+            removed = old_tasks.keys() - self.tasks.keys()
             
-            for task_id in completed_tasks:
-                del self.tasks[task_id]
+            for task_id in removed:
+                self._forget_task_stats(task_id)
                 # Clear throttling data for completed tasks
                 self._progress_throttler.clear_task(task_id)
             
-            return len(completed_tasks)
+            return len(removed)
     
-    def _generate_task_id(self, url: str) -> str:
-        """Generate a unique task ID for a URL."""
+    def _on_task_changed(self, task_id: str, task: DownloadTask) -> None:
+        """
+        Re-account a task in the incremental stats after it changed.
+        
+        The task's current state is read under the stats lock and the delta
+        against what was last accounted for it is applied, so counters stay
+        exact even if several threads update the same task.
+        """
+        with self._stats_lock:
+            status = task.status
+            bucket = _STATUS_BUCKETS[status]
+            contribution = _progress_contribution(status, task.progress)
+            
+            previous = self._accounted.get(task_id)
+            if previous is not None:
+                prev_bucket, prev_contribution = previous
+                self._bucket_counts[prev_bucket] -= 1
+                self._progress_sum -= prev_contribution
+            
+            self._bucket_counts[bucket] += 1
+            self._progress_sum += contribution
+            self._accounted[task_id] = (bucket, contribution)
+    
+    def _forget_task_stats(self, task_id: str) -> None:
+        """Remove a task's contribution from the incremental stats."""
+        with self._stats_lock:
+            previous = self._accounted.pop(task_id, None)
+            if previous is not None:
+                prev_bucket, prev_contribution = previous
+                self._bucket_counts[prev_bucket] -= 1
+                self._progress_sum -= prev_contribution
+            if not self._accounted:
+                # Drop accumulated float error once nothing is tracked
+                self._progress_sum = 0.0
+    
+    def _generate_task_id(self, url: str, timestamp: str) -> str:
+        """
+        Generate a unique task ID for a URL.
+        
+        Args:
+            url: URL the task downloads
+            timestamp: Batch timestamp (whole seconds) appended to the ID
+            
+        Returns:
+            str: Task ID
+        """
         video_id = URLValidator.extract_video_id(url)
         if video_id:
-            return f"task_{video_id}_{int(time.time())}"
+            return 'task_' + video_id + '_' + timestamp
         else:
-            return f"task_{hash(url)}_{int(time.time())}"
+            # Deterministic across runs, unlike the per-process salted hash()
+            url_hash = hashlib.blake2b(url.encode('utf-8'), digest_size=8).hexdigest()
+            return 'task_' + url_hash + '_' + timestamp
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Get the worker pool, creating it if it doesn't exist yet.
+        
+        Returns:
+            ThreadPoolExecutor: The persistent download worker pool
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrent_downloads,
+                    thread_name_prefix='dlmgr'
+                )
+            return self._executor
     
     def _run_downloads(self) -> None:
         """Run all downloads using thread pool executor."""
         try:
-            with ThreadPoolExecutor(max_workers=self.max_concurrent_downloads) as executor:
-                self._executor = executor
-                
-                # Submit all tasks
-                for task_id, task in self.tasks.items():
-                    if self._cancel_event.is_set():
-                        break
-                    
-                    future = executor.submit(self._download_single_task, task_id, task)
-                    self._futures[task_id] = future
-                
-                # Wait for completion
-                for future in as_completed(self._futures.values()):
-                    if self._cancel_event.is_set():
-                        break
+            session = _SubmitSession(self._get_executor())
+            
+            # Queue all tasks in one pass over a snapshot, so add_urls()
+            # can't resize the dict mid-iteration
+            with self._lock:
+                pending = list(self.tasks.items())
+            
+            put = self._submit_queue.put
+            cancel_event = self._cancel_event
+            for task_id, task in pending:
+                if cancel_event.is_set():
+                    break
+                put((session, task_id, task))
+            put((session, None, None))  # End of session marker
+            
+            session.done.wait()
+            submitted = session.futures
+            
+            # Wait for completion, waking at least every half second so a
+            # cancel is noticed even while no download finishes
+            pending = set(submitted)
+            while pending and not cancel_event.is_set():
+                done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+                for future in done:
+                    # Workers record their own outcome; only a task left in a
+                    # non-terminal state means an exception escaped the worker
+                    _, task = submitted[future]
+                    if task.is_completed() or task.is_failed() or task.is_cancelled():
+                        continue
                     
                     try:
                         future.result()  # This will raise any exceptions
                     except Exception as e:
                         if self.log_callback:
                             self.log_callback(f"Error in download: {str(e)}")
+            
+            if cancel_event.is_set():
+                # Batch-cancel everything still pending in one pass, then mark
+                # the tasks that never started without touching their results
+                for future in pending:
+                    future.cancel()
+                mark_cancelled = self._mark_cancelled
+                for future, (task_id, task) in submitted.items():
+                    if future.cancelled():
+                        mark_cancelled(task_id, task)
+            
+            # The pool outlives this session, so wait for running workers
+            # to wind down after a cancel before reporting we're idle
+            wait(submitted)
         
         finally:
             with self._lock:
                 self.is_downloading = False
-                self._executor = None
                 self._futures.clear()
+                pool_shut_down = self._executor is None
+            
+            # Keep per-thread YoutubeDL sessions warm while the pool lives;
+            # release them once a cancel has shut the pool down
+            if pool_shut_down:
+                self._downloader.close()
             
             if self.log_callback:
                 if self.is_cancelled:
@@ -312,6 +564,33 @@ class DownloadManager:
                         f"Failures: {stats['failed']}"
                     )
     
+    def _submit_loop(self) -> None:
+        """Move queued tasks onto the worker pool, one session at a time."""
+        submit_queue = self._submit_queue
+        download = self._download_single_task
+        cancel_event = self._cancel_event
+        while True:
+            session, task_id, task = submit_queue.get()
+            if task_id is None:
+                session.done.set()
+                continue
+            
+            # Tasks dropped here never get a future, so nothing else would
+            # move them out of PENDING
+            if cancel_event.is_set():
+                self._mark_cancelled(task_id, task)  # Drain the rest of a cancelled session
+                continue
+            
+            try:
+                future = session.executor.submit(download, task_id, task)
+            except RuntimeError:
+                self._mark_cancelled(task_id, task)  # Pool was shut down by a concurrent cancel
+                continue
+            
+            session.futures[future] = (task_id, task)
+            with self._lock:
+                self._futures.append(future)
+    
     def _download_single_task(self, task_id: str, task: DownloadTask) -> None:
         """
         Download a single task.
@@ -321,56 +600,21 @@ class DownloadManager:
             task: DownloadTask instance
         """
         if self._cancel_event.is_set():
-            task.set_status(DownloadStatus.CANCELLED)
+            self._mark_cancelled(task_id, task)
             return
         
         try:
             # Update task status
             task.set_status(DownloadStatus.DOWNLOADING)
             self._notify_progress(task_id, {
-                'status': 'downloading',
+                'status': _STATUS_DOWNLOADING,
                 'progress': 0.0,
                 'url': task.url
             })
             
-            # Create progress callback for this specific task
-            def progress_callback(progress_data):
-                if self._cancel_event.is_set():
-                    return
-                
-                # Update task progress based on status
-                if progress_data.get('status') == 'downloading':
-                    # Calculate progress from bytes
-                    downloaded = progress_data.get('downloaded_bytes', 0)
-                    total = progress_data.get('total_bytes', 0)
-                    if total > 0:
-                        progress = (downloaded / total) * 80.0  # 80% for download
-                    else:
-                        progress = 0.0
-                    
-                    task.update_progress(progress)
-                    
-                elif progress_data.get('status') == 'converting':
-                    task.set_status(DownloadStatus.CONVERTING)
-                    task.update_progress(90.0)  # 90% when converting
-                    
-                elif progress_data.get('status') == 'completed':
-                    task.set_status(DownloadStatus.COMPLETED)
-                    task.update_progress(100.0)
-                
-                # Notify UI
-                self._notify_progress(task_id, {
-                    'status': task.status.value,
-                    'progress': task.progress,
-                    'url': task.url,
-                    'title': task.title,
-                    **progress_data
-                })
-            
-            # Create log callback for this specific task
-            def log_callback(message):
-                if self.log_callback:
-                    self.log_callback(f"[{task_id}] {message}")
+            # Per-task callbacks (bound objects rather than fresh closures)
+            progress_callback = _TaskProgressHandler(self, task_id, task)
+            log_callback = _TaskLogHandler(self, task_id)
             
             # Perform the download
             success = self._downloader.download_single(
@@ -384,37 +628,68 @@ class DownloadManager:
                 task.set_status(DownloadStatus.COMPLETED)
                 task.update_progress(100.0)
                 self._notify_progress(task_id, {
-                    'status': 'completed',
+                    'status': _STATUS_COMPLETED,
                     'progress': 100.0,
                     'url': task.url
                 })
             elif self._cancel_event.is_set():
-                task.set_status(DownloadStatus.CANCELLED)
+                self._mark_cancelled(task_id, task)
             else:
                 task.set_status(DownloadStatus.FAILED, "Download failed")
+                self._notify_progress(task_id, {
+                    'status': _STATUS_FAILED,
+                    'progress': task.progress,
+                    'url': task.url,
+                    'error': "Download failed"
+                })
         
         except Exception as e:
             if self._cancel_event.is_set():
-                task.set_status(DownloadStatus.CANCELLED)
+                self._mark_cancelled(task_id, task)
             else:
                 error_msg = str(e)
                 task.set_status(DownloadStatus.FAILED, error_msg)
                 self._notify_progress(task_id, {
-                    'status': 'failed',
+                    'status': _STATUS_FAILED,
                     'progress': task.progress,
                     'url': task.url,
                     'error': error_msg
                 })
     
+    def _mark_cancelled(self, task_id: str, task: DownloadTask) -> None:
+        """
+        Mark a task as cancelled and send the terminal progress event.
+        
+        The UI finalizes a cancellation from these events, so each task
+        reports it exactly once.
+        
+        Args:
+            task_id: ID of the task
+            task: DownloadTask instance
+        """
+        if task.is_cancelled():
+            return
+        
+        task.set_status(DownloadStatus.CANCELLED)
+        self._notify_progress(task_id, {
+            'status': _STATUS_CANCELLED,
+            'progress': task.progress,
+            'url': task.url
+        })
+    
     def _cleanup_resources(self) -> None:
         """Clean up resources after cancellation."""
         try:
-            # Shutdown executor if it exists
-            if self._executor:
-                self._executor.shutdown(wait=False)
+            # Shutdown executor if it exists; the next session rebuilds it
+            with self._lock:
+                executor = self._executor
+                self._executor = None
+            if executor:
+                executor.shutdown(wait=False)
             
             # Clear futures
-            self._futures.clear()
+            with self._lock:
+                self._futures.clear()
             
             if self.log_callback:
                 self.log_callback("Resources cleaned after cancellation")
@@ -438,6 +713,53 @@ class DownloadManager:
         """
         Internal callback for throttled progress updates.
         
+        The update is handed to the UI dispatch thread so a slow UI callback
+        never blocks a download worker. This runs under the throttler's lock,
+        so it must not block either: intermediate progress ticks are dropped
+        if the queue is full, and status changes go to the overflow buffer.
+        
+        Args:
+            task_id: ID of the task
+            progress_data: Progress information
+        """
+        if not self.progress_callback:
+            return
+        
+        overflow = self._dispatch_overflow
+        if not overflow:
+            try:
+                self._dispatch_queue.put_nowait((task_id, progress_data))
+                return
+            except Full:
+                pass
+        
+        if progress_data.get('status') in _MUST_DELIVER_STATUSES:
+            overflow.append((task_id, progress_data))
+            # Wake the dispatch thread in case it is idle; if the queue is
+            # full it is busy and checks the overflow after each item
+            try:
+                self._dispatch_queue.put_nowait((None, None))
+            except Full:
+                pass
+    
+    def _dispatch_loop(self) -> None:
+        """Deliver queued progress updates to the UI callback, one at a time."""
+        dispatch_queue = self._dispatch_queue
+        overflow = self._dispatch_overflow
+        while True:
+            task_id, progress_data = dispatch_queue.get()
+            if task_id is not None:
+                self._dispatch_progress(task_id, progress_data)
+            
+            # Overflowed updates are newer than everything still queued
+            if overflow and dispatch_queue.empty():
+                while overflow:
+                    self._dispatch_progress(*overflow.popleft())
+    
+    def _dispatch_progress(self, task_id: str, progress_data: Dict[str, Any]) -> None:
+        """
+        Deliver one progress update to the UI callback. Dispatch thread only.
+        
         Args:
             task_id: ID of the task
             progress_data: Progress information
@@ -445,9 +767,10 @@ class DownloadManager:
         # Record progress callback for performance monitoring
         record_progress_callback()
         
-        if self.progress_callback:
+        progress_callback = self.progress_callback
+        if progress_callback:
             try:
-                self.progress_callback(task_id, progress_data)
+                progress_callback(task_id, progress_data)
             except Exception as e:
                 if self.log_callback:
                     self.log_callback(f"Error in progress callback: {str(e)}")
\ No newline at end of file
@@ -2,11 +2,25 @@
 FFmpeg service for checking availability and managing FFmpeg operations.
 """
 import os
+import shutil
 import subprocess
+from functools import lru_cache
 from typing import Tuple
 from .exceptions import FFmpegNotFoundError
 
 
+# Bundled FFmpeg location (<project root>/ffmpeg/ffmpeg.exe), resolved once
+_FFMPEG_LOCAL = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'ffmpeg', 'ffmpeg.exe'
+)
+
+
+@lru_cache(maxsize=1)
+def _probe_ffmpeg() -> Tuple[bool, str]:
+    """Locate FFmpeg once per process; the result does not change while running."""
+    return FFmpegService._probe()
+
+
 class FFmpegService:
     """Service class for FFmpeg operations and validation."""
     
@@ -15,22 +29,40 @@ class FFmpegService:
         """
         Check if FFmpeg is available either locally or in system PATH.
         
+        The lookup is performed once and memoized, so repeated calls (e.g.
+        the startup dependency check followed by get_ffmpeg_path) do not
+        re-spawn the ``ffmpeg -version`` probe.
+        
         Returns:
             Tuple[bool, str]: (is_available, ffmpeg_path)
         """
+        return _probe_ffmpeg()
+    
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Forget the memoized lookup so the next check probes again."""
+        _probe_ffmpeg.cache_clear()
+    
+    @staticmethod
+    def _probe() -> Tuple[bool, str]:
+        """Uncached FFmpeg lookup used by check_availability."""
         # First try to find local FFmpeg
-        ffmpeg_local = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'ffmpeg', 'ffmpeg.exe')
+        if os.path.isfile(_FFMPEG_LOCAL):
+            return True, _FFMPEG_LOCAL
         
-        if os.path.exists(ffmpeg_local):
-            return True, ffmpeg_local
+        # If not found locally, try system PATH; a plain PATH walk rules out
+        # a missing binary without spawning a process
+        if shutil.which('ffmpeg') is None:
+            return False, ""
         
-        # If not found locally, try system PATH
         try:
+            # Output is discarded, so skip the pipes; no console flash on Windows
             result = subprocess.run(
                 ['ffmpeg', '-version'], 
-                stdout=subprocess.PIPE, 
-                stderr=subprocess.PIPE,
-                timeout=10
+                stdout=subprocess.DEVNULL, 
+                stderr=subprocess.DEVNULL,
+                timeout=3,
+                creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
             )
             if result.returncode == 0:
                 return True, 'ffmpeg'
@@ -9,6 +9,10 @@ from typing import List, Dict, Any, Optional, Tuple
 import threading
 import time
 import os
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future
+from functools import wraps
 
 from .progress_panel import ProgressPanel, LogLevel
 from .download_manager import DownloadManager
@@ -20,6 +24,81 @@ from .ui_animations import get_animator, animate_button_click, animate_error_sha
 from .performance_monitor import get_performance_monitor, record_ui_update
 
 
+# Progress status strings -> DownloadStatus
+_STATUS_MAPPING = {
+    'downloading': DownloadStatus.DOWNLOADING,
+    'converting': DownloadStatus.CONVERTING,
+    'completed': DownloadStatus.COMPLETED,
+    'failed': DownloadStatus.FAILED,
+    'cancelled': DownloadStatus.CANCELLED
+}
+
+# Statuses after which a task receives no further updates
+_TERMINAL_STATUSES = frozenset({
+    DownloadStatus.COMPLETED, DownloadStatus.FAILED, DownloadStatus.CANCELLED
+})
+
+# Log level classification; one lookahead per level, tried in priority order
+# (error > warning > success), so group 1/2/3 tells which level matched
+_LOG_LEVEL_RE = re.compile(
+    r'(?=.*?(error|failed))|(?=.*?(warning))|(?=.*?(success|completed))',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Helpful tips shown below error messages, indexed by matched group
+_ERROR_TIP_RE = re.compile(
+    r'(?=.*?(network|connection))|(?=.*?(ffmpeg))|(?=.*?(private|unavailable))',
+    re.IGNORECASE | re.DOTALL
+)
+_TIP_NETWORK = "Tip: Check your internet connection."
+_TIP_FFMPEG = "Tip: Make sure FFmpeg is installed correctly."
+_TIP_UNAVAILABLE = "Tip: The video may be private or unavailable."
+_ERROR_TIPS = (None, _TIP_NETWORK, _TIP_FFMPEG, _TIP_UNAVAILABLE)
+
+
+def _debounce(ms: int):
+    """
+    Run a Tk widget method once, after calls have stopped for an interval.
+    
+    Every call cancels the pending after() and schedules a new one, so a
+    burst of calls collapses into a single trailing call with the latest
+    arguments.
+    
+    Args:
+        ms: Quiet period in milliseconds
+    """
+    def decorator(fn):
+        after_attr = f"_{fn.__name__}_after_id"
+        
+        @wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            after_id = getattr(self, after_attr, None)
+            if after_id is not None:
+                self.after_cancel(after_id)
+            
+            def run():
+                setattr(self, after_attr, None)
+                fn(self, *args, **kwargs)
+            
+            setattr(self, after_attr, self.after(ms, run))
+        return wrapper
+    return decorator
+
+
+# How often _pump_ui_events runs while nothing is downloading
+_IDLE_PUMP_INTERVAL_MS = 250
+
+# Cancellation safety net: first check, then re-check while still cancelling
+_CANCEL_CHECK_DELAY_MS = 5000
+_CANCEL_RECHECK_INTERVAL_MS = 500
+
+# Performance sampling interval in debug mode
+_PERF_SAMPLE_INTERVAL_MS = 1000
+
+# Performance debug mode, read once at import
+_DEBUG_PERFORMANCE = os.getenv('DEBUG_PERFORMANCE', '').lower() == 'true'
+
+
 class MainWindow(ctk.CTk):
     """
     Main application window using CustomTkinter.
@@ -32,6 +111,16 @@ class MainWindow(ctk.CTk):
     - Status bar for application state
     """
     
+    # (download button, cancel button) options per layout bucket
+    _BUTTON_LAYOUTS = {
+        'tiny': ({'text': "▶", 'width': 60}, {'text': "⏹", 'width': 60}),
+        'compact': ({'text': "Download", 'width': 100}, {'text': "Cancel", 'width': 100}),
+        'normal': ({'text': "Download", 'width': 140}, {'text': "Cancel", 'width': 140}),
+    }
+    
+    # Fonts created by _get_font, keyed by (family, size, weight)
+    _FONT_CACHE: Dict[Tuple[Optional[str], int, str], ctk.CTkFont] = {}
+    
     def __init__(self):
         super().__init__()
         
@@ -45,23 +134,68 @@ class MainWindow(ctk.CTk):
         
         # Application state
         self.is_downloading = False
+        self._cancelling = False
         self.download_manager: Optional[DownloadManager] = None
-        self._current_window_width = 800
         
         # Animation and performance components
         self._animator = get_animator()
-        self._last_progress_update = 0
-        self._progress_update_throttle = 0.1  # 100ms minimum between UI updates
+        self._progress_update_throttle = 0.03  # 30ms coalescing window for UI updates
+        self._last_pulse = 0.0  # monotonic time of the last per-task success pulse
+        self._last_resize_feedback = 0.0  # monotonic time of the last resize flash
+        self._window_fg_color = self.cget("fg_color")  # restored after each flash
         self._performance_monitor = get_performance_monitor()
         
-        # Start performance monitoring in debug mode
-        if os.getenv('DEBUG_PERFORMANCE', '').lower() == 'true':
-            self._performance_monitor.start_monitoring()
+        # Worker -> UI hand-off. Download threads never touch Tk: they only
+        # store the latest progress per task and queue log messages, and
+        # _pump_ui_events drains both on the Tk main thread
+        self._pending_progress: Dict[str, Dict[str, Any]] = {}
+        self._progress_lock = threading.Lock()
+        self._pending_logs: deque = deque()
+        
+        # Last (status, whole percent) applied per task, to skip no-op updates
+        self._task_state: Dict[str, Tuple[DownloadStatus, int]] = {}
+        
+        # Status bar text waiting to be committed by _flush_status
+        self._pending_status: Optional[str] = None
+        self._status_flush_pending = False
+        self._last_committed_status = "Status: Ready"
+        
+        # Pending debounced Download-button refresh after typing
+        self._url_check_after_id: Optional[str] = None
+        
+        # Width the layout was last adjusted for (see _apply_window_resize)
+        self._layout_width: Optional[int] = None
+        self._layout_bucket: Optional[str] = None
+        self._responsive_sizes: Optional[Tuple[int, int]] = None  # (title size, textbox height)
+        
+        # URL box content split into lines, re-read only after the Text
+        # widget's modified flag is set (see _get_url_lines)
+        self._url_lines: List[str] = []
+        
+        # Blocking checks (disk, FFmpeg probe) run here, off the Tk thread
+        self._io_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="mw-io")
+        self._validating = False
+        # Finished checks as (url_lines, future), queued by the executor
+        # thread and applied by _pump_ui_events
+        self._pending_validations: deque = deque()
+        self._ffmpeg_check: Optional[Tuple[bool, str]] = None  # Last successful FFmpeg probe
+        
+        # Sample performance in debug mode. Sampling runs on the Tk loop
+        # rather than the monitor's own thread, because the warning
+        # callback reconfigures widgets
+        self._perf_after_id: Optional[str] = None
+        self._cancel_check_after_id: Optional[str] = None  # See _cancel_safety_check
+        if _DEBUG_PERFORMANCE:
             self._performance_monitor.add_warning_callback(self._on_performance_warning)
+            self._perf_after_id = self.after(_PERF_SAMPLE_INTERVAL_MS, self._perf_tick)
         
         # Register for theme changes
         self.theme_manager.register_theme_callback(self._on_theme_changed)
         
+        # Widgets referenced by layout callbacks, created in _setup_ui
+        self.download_button: Optional[ctk.CTkButton] = None
+        self.cancel_button: Optional[ctk.CTkButton] = None
+        
         # Initialize components
         self._setup_ui()
         self._setup_download_manager()
@@ -69,6 +203,9 @@ class MainWindow(ctk.CTk):
         # Configure window closing behavior
         self.protocol("WM_DELETE_WINDOW", self._on_closing)
         
+        # Start draining worker events on the main thread
+        self._pump_after_id: Optional[str] = self.after(_IDLE_PUMP_INTERVAL_MS, self._pump_ui_events)
+        
         # Bind resize event for responsiveness
         self.bind("<Configure>", self._on_window_resize)
     
@@ -78,6 +215,9 @@ class MainWindow(ctk.CTk):
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(3, weight=1)  # Progress panel gets most space (row 3)
         
+        # Snapshot theme colors used by the input event handlers
+        self._cache_theme_colors()
+        
         # Create main sections
         self._create_header_section()
         self._create_url_input_section()
@@ -85,6 +225,12 @@ class MainWindow(ctk.CTk):
         self._create_progress_section()
         self._create_status_bar()
     
+    def _cache_theme_colors(self):
+        """Cache theme colors read on hot paths; refreshed on theme changes."""
+        palette = self.theme_manager.snapshot_palette()
+        self._c_text_primary = palette["text_primary"]
+        self._c_text_placeholder = palette["text_placeholder"]
+    
     def _create_header_section(self):
         """Create the application header."""
         header_frame = self.theme_manager.create_themed_frame(self)
@@ -109,7 +255,7 @@ class MainWindow(ctk.CTk):
             button_type="secondary",
             width=35,
             height=35,
-            font=ctk.CTkFont(size=14)
+            font=self._get_font(size=14)
         )
         self.folder_button.grid(row=0, column=1, pady=15, padx=(0, 5), sticky="e")
         
@@ -121,10 +267,28 @@ class MainWindow(ctk.CTk):
             button_type="secondary",
             width=35,
             height=35,
-            font=ctk.CTkFont(size=14)
+            font=self._get_font(size=14)
         )
         self.theme_button.grid(row=0, column=2, pady=15, padx=(0, 15), sticky="e")
     
+    def _get_font(self, size: int, weight: str = "normal", family: Optional[str] = None) -> ctk.CTkFont:
+        """
+        Get a font from the shared cache, creating it on first use.
+        
+        Args:
+            size: Font size
+            weight: Font weight ("normal" or "bold")
+            family: Font family, or None for the CustomTkinter default
+            
+        Returns:
+            The cached CTkFont
+        """
+        key = (family, size, weight)
+        font = self._FONT_CACHE.get(key)
+        if font is None:
+            font = self._FONT_CACHE[key] = ctk.CTkFont(family=family, size=size, weight=weight)
+        return font
+    
     def _create_url_input_section(self):
         """Create the URL input section."""
         input_frame = self.theme_manager.create_themed_frame(self)
@@ -146,7 +310,7 @@ class MainWindow(ctk.CTk):
             font=self.theme_manager.get_font("body"),
             wrap="word",
             fg_color=self.theme_manager.get_color("bg_tertiary"),
-            text_color=self.theme_manager.get_color("text_primary"),
+            text_color=self._c_text_placeholder,  # Starts out showing the placeholder
             border_color=self.theme_manager.get_color("border")
         )
         self.url_textbox.grid(row=1, column=0, padx=20, pady=(0, 15), sticky="ew")
@@ -154,7 +318,6 @@ class MainWindow(ctk.CTk):
         # Add placeholder text
         placeholder_text = "Paste the YouTube video URLs here (one per line)..."
         self.url_textbox.insert("1.0", placeholder_text)
-        self.url_textbox.configure(text_color=self.theme_manager.get_color("text_placeholder"))
         
         # Track if placeholder is active
         self._placeholder_active = True
@@ -202,10 +365,33 @@ class MainWindow(ctk.CTk):
         self.cancel_button.grid_remove()  # Hide initially
     
     def _create_progress_section(self):
-        """Create the progress panel section."""
-        # Progress panel (integrated component)
-        self.progress_panel = ProgressPanel(self)
-        self.progress_panel.grid(row=3, column=0, sticky="nsew", padx=20, pady=10)
+        """Reserve the progress panel row; the panel itself is built on first use."""
+        self._progress_panel: Optional[ProgressPanel] = None
+        self._progress_placeholder = self.theme_manager.create_themed_frame(self)
+        self._progress_placeholder.grid(row=3, column=0, sticky="nsew", padx=20, pady=10)
+    
+    def _ensure_progress_panel(self) -> ProgressPanel:
+        """
+        Build the progress panel in place of its placeholder, if not done yet.
+        
+        Must be called on the Tk main thread.
+        
+        Returns:
+            ProgressPanel: The progress panel
+        """
+        if self._progress_panel is None:
+            self._progress_placeholder.destroy()
+            self._progress_panel = ProgressPanel(self)
+            self._progress_panel.grid(row=3, column=0, sticky="nsew", padx=20, pady=10)
+        return self._progress_panel
+    
+    @property
+    def progress_panel(self) -> ProgressPanel:
+        """Progress panel (integrated component), created lazily."""
+        panel = self._progress_panel
+        if panel is None:
+            panel = self._ensure_progress_panel()
+        return panel
     
     def _create_status_bar(self):
         """Create the status bar at the bottom."""
@@ -221,6 +407,43 @@ class MainWindow(ctk.CTk):
             anchor="w"
         )
         self.status_label.grid(row=0, column=0, padx=15, pady=8, sticky="w")
+        
+        # Inline error banner (hidden until an error is shown); used instead of
+        # modal dialogs so errors never block the event loop
+        self._error_banner = self.theme_manager.create_themed_label(
+            status_frame,
+            text="",
+            font_type="small",
+            anchor="w",
+            justify="left",
+            fg_color=self.theme_manager.get_color("error"),
+            text_color="#FFFFFF",
+            corner_radius=6
+        )
+        self._error_banner.grid(row=1, column=0, padx=15, pady=(0, 8), sticky="ew")
+        self._error_banner.grid_remove()
+        self._error_banner_after_id: Optional[str] = None
+    
+    def _show_error_banner(self, title: str, message: str):
+        """
+        Show an error in the inline banner for a few seconds.
+        
+        Args:
+            title: Short error title
+            message: Error details
+        """
+        self._error_banner.configure(text=f"{title}: {message}")
+        self._error_banner.grid()
+        
+        # Restart the hide timer so the latest error gets its full time
+        if self._error_banner_after_id is not None:
+            self.after_cancel(self._error_banner_after_id)
+        self._error_banner_after_id = self.after(6000, self._hide_error_banner)
+    
+    def _hide_error_banner(self):
+        """Hide the inline error banner."""
+        self._error_banner_after_id = None
+        self._error_banner.grid_remove()
     
     def _setup_download_manager(self):
         """Initialize the download manager with callbacks."""
@@ -235,12 +458,13 @@ class MainWindow(ctk.CTk):
         """
         Validate that the download environment is ready.
         
+        Does blocking I/O; runs on the I/O executor, not the Tk thread.
+        
         Returns:
             Tuple[bool, str]: (is_valid, error_message)
         """
         try:
             # Check if downloads directory exists and is writable
-            import os
             downloads_dir = "downloads"
             
             if not os.path.exists(downloads_dir):
@@ -258,22 +482,43 @@ class MainWindow(ctk.CTk):
             except Exception as e:
                 return False, f"No write permission in downloads folder: {str(e)}"
             
-            # Check FFmpeg availability
-            from .ffmpeg_service import FFmpegService
-            ffmpeg_available, ffmpeg_path = FFmpegService.check_availability()
-            if not ffmpeg_available:
-                return False, "FFmpeg not found. Please verify it's installed in the 'ffmpeg' folder or in the system."
+            # Check FFmpeg availability; a found FFmpeg is reused for the
+            # window's lifetime
+            if self._ffmpeg_check is None:
+                from .ffmpeg_service import FFmpegService
+                ffmpeg_available, ffmpeg_path = FFmpegService.check_availability()
+                if not ffmpeg_available:
+                    # Probe again next time, in case FFmpeg gets installed meanwhile
+                    FFmpegService.invalidate_cache()
+                    return False, "FFmpeg not found. Please verify it's installed in the 'ffmpeg' folder or in the system."
+                self._ffmpeg_check = (ffmpeg_available, ffmpeg_path)
             
             return True, ""
             
         except Exception as e:
             return False, f"Error validating environment: {str(e)}"
     
+    def _get_url_lines(self) -> List[str]:
+        """
+        Get the URL box content as lines, re-reading it only if it was edited.
+        
+        Returns:
+            List[str]: Lines of the URL box (empty while the placeholder shows)
+        """
+        if self._placeholder_active:
+            return []
+        
+        if self.url_textbox.edit_modified():
+            self._url_lines = self.url_textbox.get("1.0", "end-1c").split("\n")
+            self.url_textbox.edit_modified(False)
+        
+        return self._url_lines
+    
     def _on_url_text_focus(self, event=None):
         """Handle URL text focus events to manage placeholder."""
         if self._placeholder_active:
             self.url_textbox.delete("1.0", "end")
-            self.url_textbox.configure(text_color=self.theme_manager.get_color("text_primary"))
+            self.url_textbox.configure(text_color=self._c_text_primary)
             self._placeholder_active = False
     
     def _on_url_text_focus_out(self, event=None):
@@ -282,20 +527,27 @@ class MainWindow(ctk.CTk):
         if not content:
             placeholder_text = "Paste the YouTube video URLs here (one per line)..."
             self.url_textbox.insert("1.0", placeholder_text)
-            self.url_textbox.configure(text_color=self.theme_manager.get_color("text_placeholder"))
+            self.url_textbox.configure(text_color=self._c_text_placeholder)
             self._placeholder_active = True
     
     def _on_url_text_changed(self, event=None):
-        """Handle URL text changes for real-time validation."""
+        """Handle URL text changes for real-time validation, debounced to 100ms."""
+        if self._url_check_after_id is None:
+            self._url_check_after_id = self.after(100, self._update_download_button_state)
+    
+    def _update_download_button_state(self):
+        """Enable the Download button only when the URL box has content."""
+        self._url_check_after_id = None
+        
         # Don't validate if placeholder is active
         if self._placeholder_active:
             self.download_button.configure(state="disabled")
             return
         
-        # Update button state based on content
-        content = self.url_textbox.get("1.0", "end-1c").strip()
+        # Compare end index to the start instead of copying out the whole text
+        has_content = self.url_textbox.index("end-1c") != "1.0"
         
-        if content and not self.is_downloading:
+        if has_content and not self.is_downloading:
             self.download_button.configure(state="normal")
         else:
             self.download_button.configure(state="disabled")
@@ -310,33 +562,53 @@ class MainWindow(ctk.CTk):
     
     def _on_download_clicked(self):
         """Handle download button click."""
-        if self.is_downloading:
+        if self.is_downloading or self._validating:
             return
         
+        self._ensure_progress_panel()
+        
         # Get URLs from text input (skip if placeholder is active)
         if self._placeholder_active:
             messagebox.showwarning("Warning", "Please enter at least one URL.")
             return
         
-        url_text = self.url_textbox.get("1.0", "end-1c").strip()
-        if not url_text:
+        url_lines = self._get_url_lines()
+        if not any(line.strip() for line in url_lines):
             messagebox.showwarning("Warning", "Please enter at least one URL.")
             return
         
+        # Validate download environment first, off the Tk thread
+        self._validating = True
+        self._update_status("Checking environment...")
+        future = self._io_executor.submit(self._validate_download_environment)
+        future.add_done_callback(
+            lambda done: self._pending_validations.append((url_lines, done))
+        )
+    
+    def _on_environment_validated(self, url_lines: List[str], future: Future):
+        """
+        Continue a download request once the environment check has finished.
+        
+        Args:
+            url_lines: URL box lines captured when Download was clicked
+            future: Finished environment validation future
+        """
+        self._validating = False
+        
         try:
             # Clear previous progress
             self.progress_panel.clear_all_tasks()
+            self._task_state.clear()
             
-            # Validate download environment first
-            env_valid, env_error = self._validate_download_environment()
+            env_valid, env_error = future.result()
             if not env_valid:
                 self.progress_panel.log_error(f"Invalid environment: {env_error}")
-                messagebox.showerror("Configuration Error", env_error)
+                self._show_error_banner("Configuration Error", env_error)
                 self._update_status("Configuration error")
                 return
             
             # Extract and validate URLs
-            urls = URLValidator.extract_urls_from_text(url_text)
+            urls = URLValidator.extract_urls_from_lines(url_lines)
             if not urls:
                 error_msg = "No valid YouTube URL was found.\n\nPlease verify that the URLs are in the correct format:\n• https://www.youtube.com/watch?v=...\n• https://youtu.be/..."
                 self.progress_panel.log_error("No valid URL found")
@@ -344,7 +616,7 @@ class MainWindow(ctk.CTk):
                 # Animate error with shake effect
                 animate_error_shake(self.url_textbox)
                 
-                messagebox.showerror("Validation Error", error_msg)
+                self._show_error_banner("Validation Error", error_msg)
                 self._update_status("Invalid URLs")
                 return
             
@@ -352,13 +624,11 @@ class MainWindow(ctk.CTk):
             self.progress_panel.log_info(f"Found {len(urls)} valid URL(s) for download")
             
             # Add URLs to download manager
-            task_ids = self.download_manager.add_urls([url_text])
+            task_ids = self.download_manager.add_urls(urls)
             
-            # Create download tasks in progress panel
-            for task_id in task_ids:
-                task = self.download_manager.get_task_status(task_id)
-                if task:
-                    self.progress_panel.add_download_task(task)
+            # Create download tasks in progress panel in one batch
+            tasks = self.download_manager.get_tasks_status(task_ids)
+            self.progress_panel.add_download_tasks(tasks)
             
             # Update UI state
             self._set_downloading_state(True)
@@ -372,19 +642,19 @@ class MainWindow(ctk.CTk):
                 self._set_downloading_state(False)
                 error_msg = "Could not start the download. Please verify that there are valid URLs."
                 self.progress_panel.log_error(error_msg)
-                messagebox.showerror("Error", error_msg)
+                self._show_error_banner("Error", error_msg)
                 self._update_status("Error starting download")
         
         except URLValidationError as e:
             self.progress_panel.log_error(f"Validation error: {str(e)}")
             animate_error_shake(self.url_textbox)
-            messagebox.showerror("Validation Error", str(e))
+            self._show_error_banner("Validation Error", str(e))
             self._update_status("Validation error")
         except Exception as e:
             error_msg = f"Unexpected error: {str(e)}"
             self.progress_panel.log_error(error_msg)
             animate_error_shake(self.download_button)
-            messagebox.showerror("Error", error_msg)
+            self._show_error_banner("Error", error_msg)
             self._set_downloading_state(False)
             self._update_status("Error")
     
@@ -417,6 +687,7 @@ class MainWindow(ctk.CTk):
         if result:
             try:
                 # Update UI immediately to show cancellation is in progress
+                self._cancelling = True
                 self.cancel_button.configure(text="Cancelando...", state="disabled")
                 self._update_status("Cancelling downloads...")
 
@@ -424,123 +695,91 @@ class MainWindow(ctk.CTk):
                 self.progress_panel.log_warning("Cancellation requested by user...")
                 self.progress_panel.log_info("Stopping downloads in progress...")
                 
-                # Cancel downloads
+                # Cancel downloads; the cancelled progress events finish the
+                # job via _check_download_completion
                 self.download_manager.cancel_download()
                 
-                # Schedule UI updates
-                self._schedule_cancellation_updates()
+                # Safety net in case no terminal event ever arrives
+                if self._cancel_check_after_id is not None:
+                    self.after_cancel(self._cancel_check_after_id)
+                self._cancel_check_after_id = self.after(_CANCEL_CHECK_DELAY_MS, self._cancel_safety_check)
                 
             except Exception as e:
                 error_msg = f"Error canceling downloads: {str(e)}"
                 self.progress_panel.log_error(error_msg)
-                messagebox.showerror("Error", error_msg)
+                self._show_error_banner("Error", error_msg)
                 
                 # Reset cancel button on error
+                self._cancelling = False
                 self.cancel_button.configure(text="Cancel", state="normal")
     
-    def _schedule_cancellation_updates(self):
-        """Schedule periodic updates during cancellation process."""
-        def check_cancellation_progress():
-            if not self.is_downloading:
-                # Cancellation completed
-                self.cancel_button.configure(text="Cancel", state="normal")
-                return
-            
-            # Check if downloads are still active
-            stats = self.download_manager.get_overall_progress()
-            active_count = stats['active'] + stats['pending']
-            
-            if active_count == 0:
-                # All downloads cancelled
-                self.progress_panel.log_warning("All downloads have been canceled")
-                self._set_downloading_state(False)
-                self._update_status("Canceled downloads")
-            else:
-                # Still cancelling, check again in 500ms
-                # Update cancel button text to show progress
-                remaining_text = f"Canceling... ({active_count})"
-                self.cancel_button.configure(text=remaining_text)
-                self.after(500, check_cancellation_progress)
+    def _cancel_safety_check(self):
+        """Re-check a cancellation that progress events have not finished yet."""
+        self._cancel_check_after_id = None
+        if not (self._cancelling and self.is_downloading):
+            return
         
-        # Start checking after a short delay
-        self.after(500, check_cancellation_progress)
+        self._check_download_completion()
+        if self._cancelling and self.is_downloading:
+            self._cancel_check_after_id = self.after(_CANCEL_RECHECK_INTERVAL_MS, self._cancel_safety_check)
     
     def _on_download_progress(self, task_id: str, progress_data: Dict[str, Any]):
         """
-        Handle download progress updates with throttling for better performance.
+        Queue a download progress update for the Tk main thread.
+        
+        Called from download threads. Only the latest update per task is
+        kept until the next _pump_ui_events run applies it.
         
         Args:
             task_id: ID of the task being updated
             progress_data: Progress information
         """
-        # Throttle UI updates for better performance
-        current_time = time.time()
-        if current_time - self._last_progress_update < self._progress_update_throttle:
-            # Skip this update if too frequent, unless it's a status change
-            status = progress_data.get('status', '')
-            if status not in ['completed', 'failed', 'cancelled', 'converting']:
-                return
+        with self._progress_lock:
+            self._pending_progress[task_id] = progress_data
+    
+    def _pump_ui_events(self):
+        """Apply queued worker logs, progress and finished checks on the Tk main thread, then re-arm."""
+        try:
+            # Logs first, so a batch's completion summary lands after them
+            pending_logs = self._pending_logs
+            while pending_logs:
+                self._apply_download_log(pending_logs.popleft())
+            
+            self._flush_progress()
+            
+            pending_validations = self._pending_validations
+            while pending_validations:
+                self._on_environment_validated(*pending_validations.popleft())
+        finally:
+            busy = self.is_downloading or self.download_manager.is_downloading
+            interval = int(self._progress_update_throttle * 1000) if busy else _IDLE_PUMP_INTERVAL_MS
+            self._pump_after_id = self.after(interval, self._pump_ui_events)
+    
+    def _flush_progress(self):
+        """Apply all queued progress updates in one batch on the Tk main thread."""
+        with self._progress_lock:
+            pending = self._pending_progress
+            self._pending_progress = {}
         
-        self._last_progress_update = current_time
+        if not pending:
+            return
         
         # Record UI update for performance monitoring
         record_ui_update()
         
         try:
-            url = progress_data.get('url', '')
-            status_str = progress_data.get('status', 'unknown')
-            progress = progress_data.get('progress', 0.0)
-            title = progress_data.get('title', '')
-            error = progress_data.get('error', '')
-            
-            # Convert status string to DownloadStatus enum
-            status_mapping = {
-                'downloading': DownloadStatus.DOWNLOADING,
-                'converting': DownloadStatus.CONVERTING,
-                'completed': DownloadStatus.COMPLETED,
-                'failed': DownloadStatus.FAILED,
-                'cancelled': DownloadStatus.CANCELLED
-            }
-            
-            status = status_mapping.get(status_str, DownloadStatus.PENDING)
-            
-            # Log status changes for better user feedback
-            if status == DownloadStatus.DOWNLOADING and title:
-                self.progress_panel.log_info(f"Downloading: {title}")
-            elif status == DownloadStatus.CONVERTING:
-                self.progress_panel.log_info(f"Converting to MP3: {title or url}")
-            elif status == DownloadStatus.COMPLETED:
-                self.progress_panel.log_success(f"Completed: {title or url}")
-                # Animate success with subtle pulse
-                animate_success_pulse(self.progress_panel)
-            elif status == DownloadStatus.FAILED:
-                error_msg = f"Download failed: {title or url}"
-                if error:
-                    error_msg += f" - {error}"
-                self.progress_panel.log_error(error_msg)
-            elif status == DownloadStatus.CANCELLED:
-                self.progress_panel.log_warning(f"Canceled: {title or url}")
-            
-            # Update progress panel
-            self.progress_panel.update_download_task(
-                url=url,
-                progress=progress,
-                status=status,
-                title=title
-            )
+            finished = False
+            for task_id, progress_data in pending.items():
+                status = self._apply_task_progress(task_id, progress_data)
+                if status in _TERMINAL_STATUSES:
+                    finished = True
             
             # Update overall progress
             overall_stats = self.download_manager.get_overall_progress()
             self.progress_panel.update_general_progress(overall_stats['overall_progress'])
             
-            # Update status bar with current activity
-            if status == DownloadStatus.DOWNLOADING:
-                self._update_status(f"Downloading: {title or 'file'}")
-            elif status == DownloadStatus.CONVERTING:
-                self._update_status(f"Converting: {title or 'file'}")
-            
             # Check if all downloads are complete
-            if status in [DownloadStatus.COMPLETED, DownloadStatus.FAILED, DownloadStatus.CANCELLED]:
+            if finished:
                 self._check_download_completion()
         
         except Exception as e:
@@ -548,33 +787,112 @@ class MainWindow(ctk.CTk):
             self.progress_panel.log_error(error_msg)
             print(f"Progress callback error: {e}")  # Debug logging
     
+    def _apply_task_progress(self, task_id: str, progress_data: Dict[str, Any]) -> DownloadStatus:
+        """
+        Apply a single task's progress update to the UI.
+        
+        Updates that change neither the status nor the whole-percent
+        progress are skipped, and status messages are only logged when
+        the status actually changes.
+        
+        Args:
+            task_id: ID of the task being updated
+            progress_data: Progress information
+            
+        Returns:
+            DownloadStatus: Status carried by the update
+        """
+        url = progress_data.get('url', '')
+        status_str = progress_data.get('status', 'unknown')
+        progress = progress_data.get('progress', 0.0)
+        title = progress_data.get('title', '')
+        error = progress_data.get('error', '')
+        
+        # Convert status string to DownloadStatus enum
+        status = _STATUS_MAPPING.get(status_str, DownloadStatus.PENDING)
+        
+        # Skip updates the UI already shows
+        state = (status, int(progress))
+        previous = self._task_state.get(task_id)
+        if state == previous:
+            return status
+        self._task_state[task_id] = state
+        status_changed = previous is None or previous[0] != status
+        
+        # Log status changes for better user feedback
+        if not status_changed:
+            pass
+        elif status == DownloadStatus.DOWNLOADING and title:
+            self.progress_panel.log_info(f"Downloading: {title}")
+        elif status == DownloadStatus.CONVERTING:
+            self.progress_panel.log_info(f"Converting to MP3: {title or url}")
+        elif status == DownloadStatus.COMPLETED:
+            self.progress_panel.log_success(f"Completed: {title or url}")
+            # Animate success with subtle pulse, at most once per second
+            now = time.monotonic()
+            if now - self._last_pulse > 1.0:
+                self._last_pulse = now
+                animate_success_pulse(self.progress_panel)
+        elif status == DownloadStatus.FAILED:
+            error_msg = f"Download failed: {title or url}"
+            if error:
+                error_msg += f" - {error}"
+            self.progress_panel.log_error(error_msg)
+        elif status == DownloadStatus.CANCELLED:
+            self.progress_panel.log_warning(f"Canceled: {title or url}")
+        
+        # Update progress panel
+        self.progress_panel.update_download_task(
+            url=url,
+            progress=progress,
+            status=status,
+            title=title
+        )
+        
+        # Update status bar with current activity
+        if status == DownloadStatus.DOWNLOADING:
+            self._update_status(f"Downloading: {title or 'file'}")
+        elif status == DownloadStatus.CONVERTING:
+            self._update_status(f"Converting: {title or 'file'}")
+        
+        return status
+    
     def _on_download_log(self, message: str):
         """
         Handle download log messages.
         
+        Messages from download threads are queued for _pump_ui_events;
+        those logged on the Tk main thread are shown right away.
+        
+        Args:
+            message: Log message to display
+        """
+        if threading.current_thread() is threading.main_thread():
+            self._apply_download_log(message)
+        else:
+            self._pending_logs.append(message)
+    
+    def _apply_download_log(self, message: str):
+        """
+        Classify a download log message and add it to the progress panel.
+        
         Args:
             message: Log message to display
         """
         # Determine log level based on message content
-        message_lower = message.lower()
+        match = _LOG_LEVEL_RE.match(message)
+        level = match.lastindex if match else 0
         
-        # Check for specific error types and provide helpful messages
-        if "error" in message_lower or "failed" in message_lower:
+        if level == 1:
             # Add helpful context for common errors
-            if "network" in message_lower or "connection" in message_lower:
-                enhanced_message = f"{message}\nTip: Check your internet connection."
-            elif "ffmpeg" in message_lower:
-                enhanced_message = f"{message}\nTip: Make sure FFmpeg is installed correctly."
-            elif "private" in message_lower or "unavailable" in message_lower:
-                enhanced_message = f"{message}\nTip: The video may be private or unavailable."
-            else:
-                enhanced_message = message
+            tip_match = _ERROR_TIP_RE.match(message)
+            tip = _ERROR_TIPS[tip_match.lastindex] if tip_match else None
             
-            self.progress_panel.log_error(enhanced_message)
+            self.progress_panel.log_error(message, tip=tip)
             
-        elif "warning" in message_lower:
+        elif level == 2:
             self.progress_panel.log_warning(message)
-        elif "success" in message_lower or "completed" in message_lower:
+        elif level == 3:
             self.progress_panel.log_success(message)
         else:
             self.progress_panel.log_info(message)
@@ -587,6 +905,19 @@ class MainWindow(ctk.CTk):
         stats = self.download_manager.get_overall_progress()
         active_downloads = stats['active'] + stats['pending']
         
+        if self._cancelling and self.is_downloading:
+            if active_downloads == 0:
+                # All downloads cancelled
+                self._cancelling = False
+                self.cancel_button.configure(text="Cancel", state="normal")
+                self.progress_panel.log_warning("All downloads have been canceled")
+                self._set_downloading_state(False)
+                self._update_status("Canceled downloads")
+            else:
+                # Still cancelling; show how many remain
+                self.cancel_button.configure(text=f"Canceling... ({active_downloads})")
+            return
+        
         if active_downloads == 0 and self.is_downloading:
             # All downloads are complete
             self._set_downloading_state(False)
@@ -594,6 +925,7 @@ class MainWindow(ctk.CTk):
             # Create comprehensive completion message
             completion_parts = []
             status_parts = []
+            summary: List[Tuple[LogLevel, str]] = []
             
             if stats['completed'] > 0:
                 completion_parts.append(f"{stats['completed']} file(s) successfully downloaded")
@@ -611,11 +943,11 @@ class MainWindow(ctk.CTk):
             if completion_parts:
                 final_message = "Downloads finished! " + ", ".join(completion_parts) + "."
                 if stats['completed'] > 0 and stats['failed'] == 0 and stats['cancelled'] == 0:
-                    self.progress_panel.log_success(final_message)
+                    summary.append((LogLevel.SUCCESS, final_message))
                 elif stats['failed'] > 0 or stats['cancelled'] > 0:
-                    self.progress_panel.log_warning(final_message)
+                    summary.append((LogLevel.WARNING, final_message))
                 else:
-                    self.progress_panel.log_info(final_message)
+                    summary.append((LogLevel.INFO, final_message))
             
             # Update status bar
             if status_parts:
@@ -626,7 +958,13 @@ class MainWindow(ctk.CTk):
             
             # Show completion notification if there were successful downloads
             if stats['completed'] > 0:
-                self.progress_panel.log_info(f"Files saved in folder: {self.download_manager.download_folder}")
+                summary.append((LogLevel.INFO, f"Files saved in folder: {self.download_manager.download_folder}"))
+            
+            # Write the whole summary in one go
+            if summary:
+                self.progress_panel.log_summary(summary)
+            
+            if stats['completed'] > 0:
                 # Animate overall success
                 animate_success_pulse(self.progress_panel)
     
@@ -656,7 +994,7 @@ class MainWindow(ctk.CTk):
             self.url_textbox.configure(state="normal")
             
             # Update button state based on content
-            self._on_url_text_changed()
+            self._update_download_button_state()
             
             # Update status
             if not downloading:
@@ -666,10 +1004,29 @@ class MainWindow(ctk.CTk):
         """
         Update the status bar text.
         
+        Updates are coalesced: only the latest status set before the next
+        idle point is written to the label.
+        
         Args:
             status: Status message to display
         """
-        self.status_label.configure(text=f"Status: {status}")
+        self._pending_status = status
+        if not self._status_flush_pending:
+            self._status_flush_pending = True
+            self.after_idle(self._flush_status)
+    
+    def _flush_status(self):
+        """Write the latest pending status to the label, if it changed."""
+        status = self._pending_status
+        self._pending_status = None
+        self._status_flush_pending = False
+        if status is None:
+            return
+        
+        text = f"Status: {status}"
+        if text != self._last_committed_status:
+            self._last_committed_status = text
+            self.status_label.configure(text=text)
     
     def _on_closing(self):
         """Handle window closing event."""
@@ -703,6 +1060,16 @@ class MainWindow(ctk.CTk):
             # Unregister theme callback
             if hasattr(self, 'theme_manager'):
                 self.theme_manager.unregister_theme_callback(self._on_theme_changed)
+            if self._perf_after_id is not None:
+                self.after_cancel(self._perf_after_id)
+                self._perf_after_id = None
+            if self._cancel_check_after_id is not None:
+                self.after_cancel(self._cancel_check_after_id)
+                self._cancel_check_after_id = None
+            if self._pump_after_id is not None:
+                self.after_cancel(self._pump_after_id)
+                self._pump_after_id = None
+            self._io_executor.shutdown(wait=False)
             self.destroy()
         except Exception as e:
             print(f"Error during force close: {e}")
@@ -749,78 +1116,115 @@ class MainWindow(ctk.CTk):
         icon = "🌙" if current_theme == ThemeMode.DARK else "☀️"
         self.theme_button.configure(text=icon)
         
-        # Update URL textbox colors
+        # Refresh cached colors before anything uses them
+        self._cache_theme_colors()
+        
+        palette = self.theme_manager.snapshot_palette()
+        
+        # Update error banner color
+        self._error_banner.configure(fg_color=palette["error"])
+        
+        # Update URL textbox colors, keeping the placeholder color if active
         self.url_textbox.configure(
-            fg_color=self.theme_manager.get_color("bg_tertiary"),
-            border_color=self.theme_manager.get_color("border")
+            fg_color=palette["bg_tertiary"],
+            border_color=palette["border"],
+            text_color=self._c_text_placeholder if self._placeholder_active else self._c_text_primary
         )
         
-        # Update placeholder text color if active
-        if self._placeholder_active:
-            self.url_textbox.configure(text_color=self.theme_manager.get_color("text_placeholder"))
-        else:
-            self.url_textbox.configure(text_color=self.theme_manager.get_color("text_primary"))
-        
         # Update progress panel theme
-        if hasattr(self, 'progress_panel'):
-            self.progress_panel.update_theme()
+        if self._progress_panel is not None:
+            self._progress_panel.update_theme()
     
     def _on_window_resize(self, event=None):
         """Handle window resize events for responsive behavior."""
-        if event and event.widget == self:
-            new_width = event.width
-            new_height = event.height
-            
-            # Update current dimensions
-            self._current_window_width = new_width
-            
-            # Adjust layout for very small windows
-            if new_width < 600:
-                self._update_compact_layout()
-            else:
-                self._update_normal_layout()
-    
-    def _update_compact_layout(self):
-        """Update layout for compact/small windows."""
-        # Update button text and size for small windows
-        if hasattr(self, 'download_button'):
-            if self._current_window_width < 450:
-                self.download_button.configure(text="▶", width=60)  # Very compact
-            elif self._current_window_width < 550:
-                self.download_button.configure(text="Download", width=100)  # Compact
-            else:
-                self.download_button.configure(text="Download", width=140)  # Normal
+        # <Configure> fires for every descendant too; only the window matters,
+        # and moves or height-only changes leave the layout as it is
+        if event and event.widget is self and event.width != self._layout_width:
+            self._apply_window_resize(event.width)
+    
+    @_debounce(120)
+    def _apply_window_resize(self, new_width: int):
+        """
+        Adjust the layout to a new window width once resizing has paused.
         
-        if hasattr(self, 'cancel_button'):
-            if self._current_window_width < 450:
-                self.cancel_button.configure(text="⏹", width=60)  # Very compact
-            elif self._current_window_width < 550:
-                self.cancel_button.configure(text="Cancel", width=100)  # Compact
-            else:
-                self.cancel_button.configure(text="Cancel", width=140)  # Normal
+        Args:
+            new_width: New window width in pixels
+        """
+        self._layout_width = new_width
+        self._update_button_layout(new_width)
+        self._update_responsive_layout(new_width)
     
-    def _update_normal_layout(self):
-        """Update layout for normal/large windows."""
-        # Restore normal button text and size
-        if hasattr(self, 'download_button'):
-            self.download_button.configure(text="Download", width=140)
+    def _update_button_layout(self, width: int):
+        """
+        Switch the button text and size between the layout buckets.
+        
+        Buttons are only reconfigured when the width crosses into a
+        different bucket.
         
-        if hasattr(self, 'cancel_button'):
-            self.cancel_button.configure(text="Cancel", width=140)
+        Args:
+            width: Current window width in pixels
+        """
+        if width < 450:
+            bucket = 'tiny'  # Very compact
+        elif width < 550:
+            bucket = 'compact'
+        else:
+            bucket = 'normal'
+        
+        if bucket == self._layout_bucket:
+            return
+        self._layout_bucket = bucket
+        
+        download_spec, cancel_spec = self._BUTTON_LAYOUTS[bucket]
+        if self.download_button is not None:
+            self.download_button.configure(**download_spec)
+        
+        if self.cancel_button is not None:
+            self.cancel_button.configure(**cancel_spec)
     
-    def _update_responsive_layout(self):
-        """Update layout based on current window size."""
-        # Get responsive padding
-        h_pad, v_pad = self.theme_manager.get_responsive_padding(self._current_window_width)
+    def _update_responsive_layout(self, width: int):
+        """
+        Update title font and textbox height for the current window size.
         
+        Args:
+            width: Current window width in pixels
+        """
         # Update responsive font sizes for title
         title_size = self.theme_manager.get_responsive_size(
-            self._current_window_width,
+            width,
             {"small": 18, "medium": 22, "large": 24}
         )
         
+        # Update textbox height
+        textbox_height = self.theme_manager.get_responsive_size(
+            width,
+            {"small": 100, "medium": 110, "large": 120}
+        )
+        
+        # Sizes only change at the theme breakpoints
+        sizes = (title_size, textbox_height)
+        previous = self._responsive_sizes
+        if sizes == previous:
+            return
+        self._responsive_sizes = sizes
+        
         # Update title font
-        title_font = ctk.CTkFont(family="Roboto", size=title_size, weight="bold")
+        title_font = self._get_font(size=title_size, weight="bold", family="Roboto")
+        self.title_label.configure(font=title_font)
+        
+        self.url_textbox.configure(height=textbox_height)
+        
+        # Provide visual feedback for resize, but not for the initial layout
+        if previous is not None:
+            self._show_resize_feedback()
+    
+    def _perf_tick(self):
+        """Take one performance sample and schedule the next one."""
+        try:
+            self._performance_monitor.sample_once()
+        except Exception as e:
+            print(f"Error in performance monitoring: {e}")
+        self._perf_after_id = self.after(_PERF_SAMPLE_INTERVAL_MS, self._perf_tick)
     
     def _on_performance_warning(self, warning_type: str, details: Dict[str, str]):
         """
@@ -834,18 +1238,18 @@ class MainWindow(ctk.CTk):
             # Automatically adjust throttling for better performance
             if warning_type == 'high_ui_updates':
                 self._progress_update_throttle = min(0.2, self._progress_update_throttle * 1.5)
-                if self.progress_panel:
-                    self.progress_panel._log_update_throttle = min(0.2, 
-                        self.progress_panel._log_update_throttle * 1.5)
+                if self._progress_panel is not None:
+                    self._progress_panel._log_update_throttle = min(0.2, 
+                        self._progress_panel._log_update_throttle * 1.5)
             
             # Log performance optimization
-            if hasattr(self, 'progress_panel') and self.progress_panel:
-                self.progress_panel.log_warning(
+            if self._progress_panel is not None:
+                self._progress_panel.log_warning(
                     f"Performance: {details.get('description', 'Unknown issue')}"
                 )
         
         # In debug mode, print all warnings
-        if os.getenv('DEBUG_PERFORMANCE', '').lower() == 'true':
+        if _DEBUG_PERFORMANCE:
             print(f"Performance Warning [{warning_type}]: {details.get('description', 'Unknown')}")
             print(f"Suggestion: {details.get('suggestion', 'No suggestion')}")
     
@@ -857,36 +1261,17 @@ class MainWindow(ctk.CTk):
             Dict with performance statistics
         """
         return self._performance_monitor.get_performance_summary()
-        self.title_label.configure(font=title_font)
-        
-        # Update button sizes
-        button_width = self.theme_manager.get_responsive_size(
-            self._current_window_width,
-            {"small": 120, "medium": 140, "large": 150}
-        )
-        
-        self.download_button.configure(width=button_width)
-        self.cancel_button.configure(width=button_width)
-        
-        # Update textbox height
-        textbox_height = self.theme_manager.get_responsive_size(
-            self._current_window_width,
-            {"small": 100, "medium": 110, "large": 120}
-        )
-        
-        self.url_textbox.configure(height=textbox_height)
-        
-        # Provide visual feedback for resize
-        self._show_resize_feedback()
     
     def _show_resize_feedback(self):
-        """Show subtle visual feedback during window resize."""
-        # Briefly highlight the window border
-        original_bg = self.cget("fg_color")
+        """Show subtle visual feedback during window resize, at most every 0.5s."""
+        now = time.monotonic()
+        if now - self._last_resize_feedback < 0.5:
+            return
+        self._last_resize_feedback = now
         
-        # Flash effect
+        # Flash effect: briefly highlight the window border
         self.configure(fg_color=self.theme_manager.get_color("primary"))
-        self.after(100, lambda: self.configure(fg_color=original_bg))
+        self.after(100, lambda: self.configure(fg_color=self._window_fg_color))
     
     def run(self):
         """Start the application main loop."""
@@ -1,9 +1,13 @@
 """
 Data models for YouTube MP3 GUI Downloader.
 """
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import Callable, Optional
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 
 class DownloadStatus(Enum):
@@ -16,7 +20,7 @@ class DownloadStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DownloadTask:
     """Represents a single download task with its current state and progress."""
     url: str
@@ -24,12 +28,16 @@ class DownloadTask:
     status: DownloadStatus = DownloadStatus.PENDING
     progress: float = 0.0
     error_message: str = ""
+    # Optional observer notified after every status/progress change
+    on_change: Optional[Callable[["DownloadTask"], None]] = field(
+        default=None, repr=False, compare=False
+    )
     
     def __post_init__(self):
         """Validate the download task after initialization."""
-        if not self.url:
-            raise ValueError("URL cannot be empty")
-        if not (0.0 <= self.progress <= 100.0):
+        if not self.url or not (0.0 <= self.progress <= 100.0):
+            if not self.url:
+                raise ValueError("URL cannot be empty")
             raise ValueError("Progress must be between 0.0 and 100.0")
     
     def update_progress(self, progress: float) -> None:
@@ -37,18 +45,24 @@ class DownloadTask:
         if not (0.0 <= progress <= 100.0):
             raise ValueError("Progress must be between 0.0 and 100.0")
         self.progress = progress
+        if self.on_change is not None:
+            self.on_change(self)
     
     def set_status(self, status: DownloadStatus, error_message: str = "") -> None:
         """Update the status of the download task."""
         self.status = status
-        if status == DownloadStatus.FAILED and error_message:
-            self.error_message = error_message
-        elif status != DownloadStatus.FAILED:
+        if status is DownloadStatus.FAILED:
+            if error_message:
+                self.error_message = error_message
+        elif self.error_message:
             self.error_message = ""
+        if self.on_change is not None:
+            self.on_change(self)
     
     def is_active(self) -> bool:
         """Check if the download task is currently active (downloading or converting)."""
-        return self.status in [DownloadStatus.DOWNLOADING, DownloadStatus.CONVERTING]
+        status = self.status
+        return status is DownloadStatus.DOWNLOADING or status is DownloadStatus.CONVERTING
     
     def is_completed(self) -> bool:
         """Check if the download task has completed successfully."""
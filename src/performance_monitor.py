@@ -2,12 +2,14 @@
 Performance monitoring utilities for the YouTube MP3 GUI Downloader.
 Provides tools to monitor and optimize application performance.
 """
+import sys
 import time
 import threading
+import itertools
 import os
-from typing import Dict, List, Optional, Callable
-from dataclasses import dataclass, field
-from collections import deque
+from array import array
+from typing import Dict, List, Optional, Callable, NamedTuple, Tuple
+from dataclasses import dataclass, fields
 
 # Optional psutil import for system metrics
 try:
@@ -17,8 +19,13 @@ except ImportError:
     PSUTIL_AVAILABLE = False
     psutil = None
 
+_BYTES_TO_MB = 1.0 / 1048576
 
-@dataclass
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class PerformanceMetrics:
     """Container for performance metrics."""
     timestamp: float
@@ -29,6 +36,26 @@ class PerformanceMetrics:
     progress_callback_count: int = 0
 
 
+# PerformanceMetrics fields, in the order of the history columns
+_HISTORY_FIELDS = tuple(f.name for f in fields(PerformanceMetrics))
+
+
+class PerformanceIssue(NamedTuple):
+    """A performance issue found in a metrics sample."""
+    type: str
+    severity: str
+    description: str
+    suggestion: str
+
+
+# Fixed suggestions for each issue type
+_SUGGEST_CPU = 'Consider reducing progress update frequency or optimizing download threads'
+_SUGGEST_MEMORY = 'Check for memory leaks or reduce concurrent downloads'
+_SUGGEST_UI_UPDATES = 'Implement better UI update throttling'
+_SUGGEST_CALLBACKS = 'Implement progress callback throttling'
+_SUGGEST_THREADS = 'Review thread pool configuration and cleanup'
+
+
 class PerformanceMonitor:
     """
     Monitors application performance and provides optimization insights.
@@ -49,24 +76,55 @@ class PerformanceMonitor:
             max_history: Maximum number of metrics to keep in history
         """
         self.max_history = max_history
-        self._metrics_history: deque = deque(maxlen=max_history)
+        # Metrics history as a ring buffer of parallel columns, one array of
+        # doubles per PerformanceMetrics field, so summaries can run sum()
+        # and max() over each column in C
+        self._history_columns = tuple(array('d', bytes(8 * max_history)) for _ in _HISTORY_FIELDS)
+        self._history_next = 0  # Slot the next sample is written to
+        self._history_count = 0
         self._monitoring = False
         self._monitor_thread: Optional[threading.Thread] = None
         self._lock = threading.Lock()
         
-        # Counters for tracking
-        self._ui_update_count = 0
-        self._progress_callback_count = 0
-        self._last_reset_time = time.time()
+        # Event counters. next() on an itertools.count is atomic under the
+        # GIL, so recording needs no lock; the bases hold the counter value
+        # at the last reset
+        self._ui_counter = itertools.count()
+        self._ui_base = 0
+        self._callback_counter = itertools.count()
+        self._callback_base = 0
+        self._last_reset_time = time.monotonic()  # Elapsed-time math only
+        
+        # Process handle reused for every sample; the first cpu_percent()
+        # call only sets the baseline, so make it here
+        self._process = None
+        if PSUTIL_AVAILABLE:
+            try:
+                self._process = psutil.Process(os.getpid())
+                self._process.cpu_percent(interval=None)
+            except Exception:
+                self._process = None  # Fall back to default values
+        
+        # System metrics reader, chosen once instead of checked every tick
+        self._read_system_metrics = (
+            self._read_process_metrics if self._process is not None else self._read_no_system_metrics
+        )
+        
+        # Counts seen by the last psutil-less tick (see sample_once)
+        self._idle_counts: Optional[Tuple[int, int]] = None
         
         # Performance thresholds
         self.cpu_warning_threshold = 80.0  # %
         self.memory_warning_threshold = 500.0  # MB
         self.ui_update_warning_rate = 100  # updates per second
         self.progress_callback_warning_rate = 50  # callbacks per second
+        self.warning_cooldown = 10.0  # seconds before the same warning repeats
         
         # Callbacks for warnings
-        self._warning_callbacks: List[Callable[[str, Dict], None]] = []
+        # Replaced, never mutated, on registration, so the sampling thread
+        # can iterate it without a lock
+        self._warning_callbacks: Tuple[Callable[[str, Dict], None], ...] = ()
+        self._last_warning_times: Dict[str, float] = {}
     
     def start_monitoring(self, interval: float = 1.0):
         """
@@ -99,17 +157,15 @@ class PerformanceMonitor:
         Args:
             callback: Function to call with (warning_type, details)
         """
-        self._warning_callbacks.append(callback)
+        self._warning_callbacks = self._warning_callbacks + (callback,)
     
     def record_ui_update(self):
         """Record a UI update event."""
-        with self._lock:
-            self._ui_update_count += 1
+        next(self._ui_counter)
     
     def record_progress_callback(self):
         """Record a progress callback event."""
-        with self._lock:
-            self._progress_callback_count += 1
+        next(self._callback_counter)
     
     def get_current_metrics(self) -> PerformanceMetrics:
         """
@@ -120,28 +176,16 @@ class PerformanceMonitor:
         """
         try:
             with self._lock:
-                current_time = time.time()
-                time_elapsed = current_time - self._last_reset_time
+                time_elapsed = time.monotonic() - self._last_reset_time
                 
-                ui_rate = self._ui_update_count / time_elapsed if time_elapsed > 0 else 0
-                callback_rate = self._progress_callback_count / time_elapsed if time_elapsed > 0 else 0
+                ui_count, callback_count = self._read_counts()
+                ui_rate = ui_count / time_elapsed if time_elapsed > 0 else 0
+                callback_rate = callback_count / time_elapsed if time_elapsed > 0 else 0
                 
-                # Get system metrics if psutil is available
-                cpu_percent = 0.0
-                memory_mb = 0.0
-                thread_count = 0
-                
-                if PSUTIL_AVAILABLE:
-                    try:
-                        process = psutil.Process(os.getpid())
-                        cpu_percent = process.cpu_percent()
-                        memory_mb = process.memory_info().rss / 1024 / 1024
-                        thread_count = process.num_threads()
-                    except Exception:
-                        pass  # Use default values if psutil fails
+                cpu_percent, memory_mb, thread_count = self._read_system_metrics()
                 
                 metrics = PerformanceMetrics(
-                    timestamp=current_time,
+                    timestamp=time.time(),
                     cpu_percent=cpu_percent,
                     memory_mb=memory_mb,
                     thread_count=thread_count,
@@ -168,7 +212,15 @@ class PerformanceMonitor:
             List[PerformanceMetrics]: Historical performance data
         """
         with self._lock:
-            return list(self._metrics_history)
+            count = self._history_count
+            start = (self._history_next - count) % self.max_history if count else 0
+            history = []
+            for offset in range(count):
+                slot = (start + offset) % self.max_history
+                values = dict(zip(_HISTORY_FIELDS, (column[slot] for column in self._history_columns)))
+                values['thread_count'] = int(values['thread_count'])
+                history.append(PerformanceMetrics(**values))
+            return history
     
     def get_performance_summary(self) -> Dict[str, float]:
         """
@@ -178,84 +230,83 @@ class PerformanceMonitor:
             Dict with performance summary statistics
         """
         with self._lock:
-            if not self._metrics_history:
+            count = self._history_count
+            if not count:
                 return {}
             
-            cpu_values = [m.cpu_percent for m in self._metrics_history]
-            memory_values = [m.memory_mb for m in self._metrics_history]
-            thread_values = [m.thread_count for m in self._metrics_history]
-            ui_update_values = [m.ui_update_count for m in self._metrics_history]
-            callback_values = [m.progress_callback_count for m in self._metrics_history]
+            # Slot order doesn't matter for sums and maxima, and the filled
+            # slots are always the first 'count' ones
+            _, cpu, memory, threads, ui_updates, callbacks = (
+                column[:count] for column in self._history_columns
+            )
             
             return {
-                'avg_cpu_percent': sum(cpu_values) / len(cpu_values),
-                'max_cpu_percent': max(cpu_values),
-                'avg_memory_mb': sum(memory_values) / len(memory_values),
-                'max_memory_mb': max(memory_values),
-                'avg_thread_count': sum(thread_values) / len(thread_values),
-                'max_thread_count': max(thread_values),
-                'avg_ui_update_rate': sum(ui_update_values) / len(ui_update_values),
-                'max_ui_update_rate': max(ui_update_values),
-                'avg_callback_rate': sum(callback_values) / len(callback_values),
-                'max_callback_rate': max(callback_values),
-                'monitoring_duration': time.time() - self._last_reset_time
+                'avg_cpu_percent': sum(cpu) / count,
+                'max_cpu_percent': max(cpu),
+                'avg_memory_mb': sum(memory) / count,
+                'max_memory_mb': max(memory),
+                'avg_thread_count': sum(threads) / count,
+                'max_thread_count': int(max(threads)),
+                'avg_ui_update_rate': sum(ui_updates) / count,
+                'max_ui_update_rate': max(ui_updates),
+                'avg_callback_rate': sum(callbacks) / count,
+                'max_callback_rate': max(callbacks),
+                'monitoring_duration': time.monotonic() - self._last_reset_time
             }
     
-    def detect_performance_issues(self) -> List[Dict[str, str]]:
+    def detect_performance_issues(self, current_metrics: Optional[PerformanceMetrics] = None) -> List[PerformanceIssue]:
         """
         Detect potential performance issues.
         
+        Args:
+            current_metrics: Already sampled metrics to check; sampled now if omitted
+        
         Returns:
             List of detected issues with descriptions and suggestions
         """
         issues = []
-        current_metrics = self.get_current_metrics()
-        summary = self.get_performance_summary()
+        if current_metrics is None:
+            current_metrics = self.get_current_metrics()
+        
+        # Check for excessive threads
+        if current_metrics.thread_count > 20:
+            issues.append(PerformanceIssue(
+                'high_threads', 'warning',
+                f'High thread count: {current_metrics.thread_count}',
+                _SUGGEST_THREADS
+            ))
         
         # Check CPU usage
         if current_metrics.cpu_percent > self.cpu_warning_threshold:
-            issues.append({
-                'type': 'high_cpu',
-                'severity': 'warning',
-                'description': f'High CPU usage: {current_metrics.cpu_percent:.1f}%',
-                'suggestion': 'Consider reducing progress update frequency or optimizing download threads'
-            })
+            issues.append(PerformanceIssue(
+                'high_cpu', 'warning',
+                f'High CPU usage: {current_metrics.cpu_percent:.1f}%',
+                _SUGGEST_CPU
+            ))
         
         # Check memory usage
         if current_metrics.memory_mb > self.memory_warning_threshold:
-            issues.append({
-                'type': 'high_memory',
-                'severity': 'warning',
-                'description': f'High memory usage: {current_metrics.memory_mb:.1f} MB',
-                'suggestion': 'Check for memory leaks or reduce concurrent downloads'
-            })
+            issues.append(PerformanceIssue(
+                'high_memory', 'warning',
+                f'High memory usage: {current_metrics.memory_mb:.1f} MB',
+                _SUGGEST_MEMORY
+            ))
         
         # Check UI update rate
         if current_metrics.ui_update_count > self.ui_update_warning_rate:
-            issues.append({
-                'type': 'high_ui_updates',
-                'severity': 'performance',
-                'description': f'High UI update rate: {current_metrics.ui_update_count:.1f}/sec',
-                'suggestion': 'Implement better UI update throttling'
-            })
+            issues.append(PerformanceIssue(
+                'high_ui_updates', 'performance',
+                f'High UI update rate: {current_metrics.ui_update_count:.1f}/sec',
+                _SUGGEST_UI_UPDATES
+            ))
         
         # Check progress callback rate
         if current_metrics.progress_callback_count > self.progress_callback_warning_rate:
-            issues.append({
-                'type': 'high_callbacks',
-                'severity': 'performance',
-                'description': f'High callback rate: {current_metrics.progress_callback_count:.1f}/sec',
-                'suggestion': 'Implement progress callback throttling'
-            })
-        
-        # Check for excessive threads
-        if current_metrics.thread_count > 20:
-            issues.append({
-                'type': 'high_threads',
-                'severity': 'warning',
-                'description': f'High thread count: {current_metrics.thread_count}',
-                'suggestion': 'Review thread pool configuration and cleanup'
-            })
+            issues.append(PerformanceIssue(
+                'high_callbacks', 'performance',
+                f'High callback rate: {current_metrics.progress_callback_count:.1f}/sec',
+                _SUGGEST_CALLBACKS
+            ))
         
         return issues
     
@@ -301,29 +352,116 @@ class PerformanceMonitor:
     def reset_counters(self):
         """Reset performance counters."""
         with self._lock:
-            self._ui_update_count = 0
-            self._progress_callback_count = 0
-            self._last_reset_time = time.time()
+            self._ui_base = next(self._ui_counter) + 1
+            self._callback_base = next(self._callback_counter) + 1
+            self._last_reset_time = time.monotonic()
+    
+    def sample_once(self):
+        """
+        Record one metrics sample and report any performance issues.
+        
+        Warning callbacks run on the calling thread, so a GUI can schedule
+        this on its own event loop instead of using start_monitoring().
+        """
+        if not self._is_idle_tick():
+            # Collect metrics
+            metrics = self.get_current_metrics()
+            
+            with self._lock:
+                self._append_history(metrics)
+            
+            # Check for performance issues, unless nobody would be told
+            if self._warning_callbacks:
+                now = time.monotonic()
+                for issue in self.detect_performance_issues(metrics):
+                    # Report each kind of issue at most once per cooldown
+                    last = self._last_warning_times.get(issue.type)
+                    if last is not None and now - last < self.warning_cooldown:
+                        continue
+                    self._last_warning_times[issue.type] = now
+                    self._notify_warning(issue.type, issue._asdict())
+        
+        # Reset counters periodically
+        if time.monotonic() - self._last_reset_time > 60:  # Reset every minute
+            self.reset_counters()
+    
+    def _is_idle_tick(self) -> bool:
+        """
+        Check whether a tick can be skipped because it would record nothing new.
+        
+        Without psutil the event counters are the only live data, so a tick
+        where neither counter moved since the previous one is idle.
+        
+        Returns:
+            bool: True if the tick should be skipped
+        """
+        if self._process is not None:
+            return False
+        with self._lock:
+            counts = self._read_counts()
+        if counts == self._idle_counts:
+            return True
+        self._idle_counts = counts
+        return False
+    
+    def _read_counts(self) -> Tuple[int, int]:
+        """
+        Get the event counts since the last reset. Call with the lock held.
+        
+        Returns:
+            Tuple of (ui_update_count, progress_callback_count)
+        """
+        # Reading a counter advances it too, so move the base past that read
+        ui_count = next(self._ui_counter) - self._ui_base
+        self._ui_base += 1
+        callback_count = next(self._callback_counter) - self._callback_base
+        self._callback_base += 1
+        return ui_count, callback_count
+    
+    def _read_process_metrics(self) -> Tuple[float, float, int]:
+        """
+        Read CPU, memory and thread usage of this process through psutil.
+        
+        Returns:
+            Tuple of (cpu_percent, memory_mb, thread_count)
+        """
+        process = self._process
+        try:
+            return process.cpu_percent(), process.memory_info().rss * _BYTES_TO_MB, process.num_threads()
+        except Exception:
+            return self._read_no_system_metrics()  # Use default values if psutil fails
+    
+    @staticmethod
+    def _read_no_system_metrics() -> Tuple[float, float, int]:
+        """
+        Default system metrics used when psutil is unavailable.
+        
+        Returns:
+            Tuple of (cpu_percent, memory_mb, thread_count)
+        """
+        return 0.0, 0.0, 0
+    
+    def _append_history(self, metrics: PerformanceMetrics):
+        """
+        Write a sample into the history ring buffer, replacing the oldest when full.
+        
+        Args:
+            metrics: Sample to store
+        """
+        if self.max_history <= 0:
+            return
+        slot = self._history_next
+        for column, name in zip(self._history_columns, _HISTORY_FIELDS):
+            column[slot] = getattr(metrics, name)
+        self._history_next = (slot + 1) % self.max_history
+        if self._history_count < self.max_history:
+            self._history_count += 1
     
     def _monitor_loop(self, interval: float):
         """Main monitoring loop."""
         while self._monitoring:
             try:
-                # Collect metrics
-                metrics = self.get_current_metrics()
-                
-                with self._lock:
-                    self._metrics_history.append(metrics)
-                
-                # Check for performance issues
-                issues = self.detect_performance_issues()
-                for issue in issues:
-                    self._notify_warning(issue['type'], issue)
-                
-                # Reset counters periodically
-                if time.time() - self._last_reset_time > 60:  # Reset every minute
-                    self.reset_counters()
-                
+                self.sample_once()
                 time.sleep(interval)
                 
             except Exception as e:
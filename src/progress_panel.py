@@ -5,15 +5,24 @@ Provides progress tracking and logging functionality.
 import tkinter as tk
 from tkinter import ttk
 import customtkinter as ctk
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from enum import Enum
-from datetime import datetime
 import threading
 import time
+from collections import deque
+from dataclasses import replace
 from .models import DownloadTask, DownloadStatus
 from .theme_manager import get_theme_manager
 
 
+# Default log retention; oldest lines are dropped beyond this so the textbox
+# doesn't grow forever (see ProgressPanel.set_max_log_lines)
+_MAX_LOG_LINES = 1000
+
+# UI work queued from other threads is drained at most this often (~30 fps)
+_UI_FRAME_MS = 33
+
+
 class LogLevel(Enum):
     """Log levels for different types of messages."""
     INFO = "info"
@@ -22,6 +31,23 @@ class LogLevel(Enum):
     SUCCESS = "success"
 
 
+# Log line prefix per level, e.g. "[INFO]"
+_LEVEL_PREFIXES = {level: f"[{level.value.upper()}]" for level in LogLevel}
+
+
+class _TaskWidgets:
+    """Widgets making up one task's row in the individual progress section."""
+    
+    __slots__ = ('frame', 'progress', 'status', 'label')
+    
+    def __init__(self, frame: ctk.CTkFrame, progress: ctk.CTkProgressBar,
+                 status: ctk.CTkLabel, label: ctk.CTkLabel):
+        self.frame = frame
+        self.progress = progress
+        self.status = status
+        self.label = label
+
+
 class ProgressPanel(ctk.CTkFrame):
     """
     Progress panel component that displays download progress and logs.
@@ -35,13 +61,14 @@ class ProgressPanel(ctk.CTkFrame):
     """
     
     def __init__(self, parent, **kwargs):
-        # Get theme manager
+        # Get theme manager and the current theme's colors
         self.theme_manager = get_theme_manager()
+        self._refresh_theme_cache()
         
         # Apply themed styling to kwargs
         themed_kwargs = {
-            "fg_color": self.theme_manager.get_color("bg_secondary"),
-            "border_color": self.theme_manager.get_color("border"),
+            "fg_color": self._theme_cache["bg_secondary"],
+            "border_color": self._theme_cache["border"],
             "corner_radius": 8
         }
         themed_kwargs.update(kwargs)
@@ -50,13 +77,33 @@ class ProgressPanel(ctk.CTkFrame):
         
         # Internal state
         self._download_tasks: Dict[str, DownloadTask] = {}
-        self._individual_progress_bars: Dict[str, ctk.CTkProgressBar] = {}
+        self._individual_progress_bars: Dict[str, _TaskWidgets] = {}
         self._lock = threading.Lock()
         
+        # Grid row of each task, and rows freed by removed tasks for reuse
+        self._task_rows: Dict[str, int] = {}
+        self._free_rows: List[int] = []
+        
+        # Running total behind the overall progress, and the (progress,
+        # status, title) each task row currently shows, readable without
+        # the lock by update_download_task
+        self._progress_sum = 0.0
+        self._row_state: Dict[str, Tuple[float, DownloadStatus, str]] = {}
+        
+        # UI callbacks queued by non-Tk threads, drained by _drain_ui_queue
+        self._ui_queue: deque = deque()
+        self._ui_tick_scheduled = False
+        self._coalesce_general_progress = False
+        self._general_progress_dirty = False
+        
         # Performance optimization
         self._last_log_update = 0
         self._log_update_throttle = 0.1  # 100ms minimum between log updates
-        self._pending_log_messages = []
+        self._pending_log_messages: deque = deque()
+        self._log_flush_scheduled = False
+        self._max_log_lines = _MAX_LOG_LINES
+        self._log_line_count = 0  # Lines currently in log_text
+        self._log_second: Tuple[int, str] = (-1, "")  # Last formatted timestamp second
         
         self._setup_ui()
     
@@ -75,6 +122,10 @@ class ProgressPanel(ctk.CTkFrame):
         # Individual progress section
         self._create_individual_progress_section()
     
+    def _refresh_theme_cache(self):
+        """Re-read the current theme's colors; call after every theme change."""
+        self._theme_cache: Dict[str, str] = self.theme_manager.snapshot_palette()
+    
     def _create_general_progress_section(self):
         """Create the general progress bar section."""
         # General progress frame
@@ -93,8 +144,8 @@ class ProgressPanel(ctk.CTkFrame):
         # General progress bar
         self.general_progress_bar = ctk.CTkProgressBar(
             progress_frame,
-            progress_color=self.theme_manager.get_color("progress_fill"),
-            fg_color=self.theme_manager.get_color("progress_bg")
+            progress_color=self._theme_cache["progress_fill"],
+            fg_color=self._theme_cache["progress_bg"]
         )
         self.general_progress_bar.grid(row=0, column=1, padx=(5, 10), pady=10, sticky="ew")
         self.general_progress_bar.set(0)
@@ -129,9 +180,9 @@ class ProgressPanel(ctk.CTkFrame):
             height=200,
             font=self.theme_manager.get_font("console"),
             wrap="word",
-            fg_color=self.theme_manager.get_color("bg_tertiary"),
-            text_color=self.theme_manager.get_color("text_primary"),
-            border_color=self.theme_manager.get_color("border")
+            fg_color=self._theme_cache["bg_tertiary"],
+            text_color=self._theme_cache["text_primary"],
+            border_color=self._theme_cache["border"]
         )
         self.log_text.grid(row=1, column=0, padx=10, pady=(0, 10), sticky="nsew")
     
@@ -153,11 +204,11 @@ class ProgressPanel(ctk.CTkFrame):
         self.individual_scroll_frame = ctk.CTkScrollableFrame(
             self.individual_frame,
             height=100,
-            fg_color=self.theme_manager.get_color("bg_tertiary"),
-            border_color=self.theme_manager.get_color("border")
+            fg_color=self._theme_cache["bg_tertiary"],
+            border_color=self._theme_cache["border"]
         )
     
-    def log_message(self, message: str, level: LogLevel = LogLevel.INFO):
+    def log_message(self, message: str, level: LogLevel = LogLevel.INFO, tip: Optional[str] = None):
         """
         Add a message to the log area with timestamp and formatting.
         Uses throttling to prevent log spam and improve performance.
@@ -165,56 +216,139 @@ class ProgressPanel(ctk.CTkFrame):
         Args:
             message: The message to log
             level: The log level (INFO, WARNING, ERROR, SUCCESS)
+            tip: Optional hint shown on its own line below the message
         """
         current_time = time.time()
         
         # Add to pending messages
-        self._pending_log_messages.append((message, level, current_time))
+        self._pending_log_messages.append((message, level, current_time, tip))
         
         # Throttle log updates for better performance
         if current_time - self._last_log_update >= self._log_update_throttle:
             self._flush_pending_logs()
         else:
             # Schedule a delayed flush if not already scheduled
-            if not hasattr(self, '_log_flush_scheduled') or not self._log_flush_scheduled:
+            if not self._log_flush_scheduled:
                 self._log_flush_scheduled = True
                 self.after(int(self._log_update_throttle * 1000), self._flush_pending_logs)
     
+    def log_summary(self, entries: List[Tuple[LogLevel, str]]):
+        """
+        Add several log lines at once, written with a single insert.
+        
+        Args:
+            entries: (level, message) pairs in display order
+        """
+        current_time = time.time()
+        self._pending_log_messages.extend(
+            (message, level, current_time, None) for level, message in entries
+        )
+        self._flush_pending_logs()
+    
+    def _run_on_ui_thread(self, callback):
+        """
+        Run a UI callback now if on the Tk thread, otherwise queue it.
+        
+        Callbacks queued from other threads are drained together by a single
+        after() per frame instead of one after(0) each.
+        
+        Args:
+            callback: Function touching Tk widgets
+        """
+        if threading.current_thread() is threading.main_thread():
+            callback()
+            return
+        
+        with self._lock:
+            self._ui_queue.append(callback)
+            if self._ui_tick_scheduled:
+                return
+            self._ui_tick_scheduled = True
+        
+        try:
+            self.after(_UI_FRAME_MS, self._drain_ui_queue)
+        except RuntimeError:
+            # If we can't schedule the callback, just execute directly
+            # This can happen during testing when the main loop isn't running
+            self._drain_ui_queue()
+    
+    def _drain_ui_queue(self):
+        """Run all queued UI callbacks, updating the overall progress only once."""
+        with self._lock:
+            callbacks = list(self._ui_queue)
+            self._ui_queue.clear()
+            self._ui_tick_scheduled = False
+        
+        self._coalesce_general_progress = True
+        try:
+            for callback in callbacks:
+                callback()
+        finally:
+            self._coalesce_general_progress = False
+        
+        if self._general_progress_dirty:
+            with self._lock:
+                self._update_general_progress()
+    
     def _flush_pending_logs(self):
         """Flush all pending log messages to the UI."""
         if not self._pending_log_messages:
             return
         
         def _add_logs():
-            messages_to_add = self._pending_log_messages.copy()
-            self._pending_log_messages.clear()
+            # Drain with popleft so messages queued meanwhile from other
+            # threads are either taken now or left for the next flush
+            pending = self._pending_log_messages
+            messages_to_add = [pending.popleft() for _ in range(len(pending))]
             self._last_log_update = time.time()
             self._log_flush_scheduled = False
             
             # Batch insert messages for better performance
-            log_content = ""
-            for message, level, timestamp_float in messages_to_add:
-                timestamp = datetime.fromtimestamp(timestamp_float).strftime("%H:%M:%S")
-                level_prefix = f"[{level.value.upper()}]"
-                log_content += f"{timestamp} {level_prefix} {message}\n"
+            parts = []
+            last_second, timestamp = self._log_second
+            for message, level, timestamp_float, tip in messages_to_add:
+                # Messages mostly share a second with the previous one, also
+                # across flushes; format each second once
+                second = int(timestamp_float)
+                if second != last_second:
+                    last_second = second
+                    timestamp = time.strftime("%H:%M:%S", time.localtime(second))
+                parts.append(f"{timestamp} {_LEVEL_PREFIXES[level]} {message}\n")
+                if tip:
+                    parts.append(tip)
+                    parts.append("\n")
             
-            if log_content:
+            self._log_second = (last_second, timestamp)
+            
+            if parts:
+                # Only follow new lines if the user hasn't scrolled up to read
+                at_bottom = self.log_text.yview()[1] >= 0.999
+                
                 # Insert all messages at once
+                log_content = "".join(parts)
                 self.log_text.insert("end", log_content)
+                self._log_line_count += log_content.count("\n")
+                
+                # Drop the oldest lines beyond the retention limit in one delete
+                excess = self._log_line_count - self._max_log_lines
+                if excess > 0:
+                    self.log_text.delete("1.0", f"{excess + 1}.0")
+                    self._log_line_count -= excess
                 
                 # Auto-scroll to bottom
-                self.log_text.see("end")
+                if at_bottom:
+                    self.log_text.see("end")
         
-        # Ensure thread safety
-        try:
-            if threading.current_thread() != threading.main_thread():
-                self.after(0, _add_logs)
-            else:
-                _add_logs()
-        except RuntimeError:
-            # If we can't schedule the callback, just execute directly
-            # This can happen during testing when the main loop isn't running
-            _add_logs()
+        self._run_on_ui_thread(_add_logs)
+    
+    def set_max_log_lines(self, max_lines: int):
+        """
+        Set how many log lines are kept; older lines are dropped on the next flush.
+        
+        Args:
+            max_lines: Maximum number of lines in the log area
+        """
+        self._max_log_lines = max(1, max_lines)
     
     def update_general_progress(self, progress: float):
         """
@@ -229,16 +363,7 @@ class ProgressPanel(ctk.CTkFrame):
             self.general_progress_bar.set(normalized_progress)
             self.progress_percentage_label.configure(text=f"{progress:.1f}%")
         
-        # Ensure thread safety
-        try:
-            if threading.current_thread() != threading.main_thread():
-                self.after(0, _update)
-            else:
-                _update()
-        except RuntimeError:
-            # If we can't schedule the callback, just execute directly
-            # This can happen during testing when the main loop isn't running
-            _update()
+        self._run_on_ui_thread(_update)
     
     def add_download_task(self, task: DownloadTask):
         """
@@ -247,68 +372,101 @@ class ProgressPanel(ctk.CTkFrame):
         Args:
             task: The download task to add
         """
-        def _add_task():
+        self.add_download_tasks([task])
+    
+    def add_download_tasks(self, tasks: List[DownloadTask]):
+        """
+        Add several download tasks at once, with a single layout pass.
+        
+        The panel keeps its own copies of the tasks, detached from any
+        on_change observer, so its updates never write back into the
+        download manager's task objects.
+        
+        Args:
+            tasks: The download tasks to add
+        """
+        tasks = [replace(task, on_change=None) for task in tasks]
+        
+        def _add_tasks():
             with self._lock:
-                self._download_tasks[task.url] = task
-                
-                # Show individual progress section if first task
-                if len(self._download_tasks) == 1:
+                # Show individual progress section if these are the first tasks
+                if tasks and not self._download_tasks:
                     self.individual_title.grid(row=0, column=0, padx=10, pady=(10, 5), sticky="w")
                     self.individual_scroll_frame.grid(row=1, column=0, padx=10, pady=(0, 10), sticky="ew")
                 
-                # Create individual progress bar
-                task_frame = self.theme_manager.create_themed_frame(self.individual_scroll_frame)
-                task_frame.grid(row=len(self._individual_progress_bars), column=0, sticky="ew", pady=2)
-                task_frame.grid_columnconfigure(1, weight=1)
-                
-                # Task title (truncated if too long)
-                title = task.title if task.title else task.url
-                if len(title) > 50:
-                    title = title[:47] + "..."
-                
-                task_label = self.theme_manager.create_themed_label(
-                    task_frame,
-                    text=title,
-                    font_type="small"
-                )
-                task_label.grid(row=0, column=0, padx=(10, 5), pady=5, sticky="w")
-                
-                # Task progress bar
-                task_progress = ctk.CTkProgressBar(
-                    task_frame, 
-                    height=15,
-                    progress_color=self.theme_manager.get_color("progress_fill"),
-                    fg_color=self.theme_manager.get_color("progress_bg")
-                )
-                task_progress.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
-                task_progress.set(task.progress / 100.0)
-                
-                # Task status label
-                task_status = self.theme_manager.create_themed_label(
-                    task_frame,
-                    text=task.status.value.upper(),
-                    font_type="small"
-                )
-                task_status.grid(row=0, column=2, padx=(5, 10), pady=5, sticky="e")
+                # Build every row first, then grid them in a second pass
+                new_rows = []
+                for task in tasks:
+                    self._download_tasks[task.url] = task
+                    previous = self._row_state.get(task.url)
+                    self._progress_sum += task.progress - (previous[0] if previous else 0.0)
+                    self._row_state[task.url] = (task.progress, task.status, task.title)
+                    row = self._task_rows.get(task.url)
+                    if row is None:
+                        row = self._free_rows.pop() if self._free_rows else len(self._task_rows)
+                        self._task_rows[task.url] = row
+                    else:
+                        # Re-added task: replace its row in place
+                        self._individual_progress_bars[task.url].frame.destroy()
+                    new_rows.append((row, self._create_task_row(task)))
                 
-                # Store references
-                self._individual_progress_bars[task.url] = {
-                    'frame': task_frame,
-                    'progress': task_progress,
-                    'status': task_status,
-                    'label': task_label
-                }
-        
-        # Ensure thread safety
-        try:
-            if threading.current_thread() != threading.main_thread():
-                self.after(0, _add_task)
-            else:
-                _add_task()
-        except RuntimeError:
-            # If we can't schedule the callback, just execute directly
-            # This can happen during testing when the main loop isn't running
-            _add_task()
+                for row, widgets in new_rows:
+                    widgets.frame.grid(row=row, column=0, sticky="ew", pady=2)
+            
+            # Lay out all new rows together
+            self.individual_scroll_frame.update_idletasks()
+        
+        self._run_on_ui_thread(_add_tasks)
+    
+    def _create_task_row(self, task: DownloadTask) -> _TaskWidgets:
+        """
+        Create the individual progress row for a task. Caller holds the lock
+        and grids the returned row frame.
+        
+        Args:
+            task: The download task to create a row for
+            
+        Returns:
+            _TaskWidgets: The widgets of the new row
+        """
+        # Create individual progress bar
+        task_frame = self.theme_manager.create_themed_frame(self.individual_scroll_frame)
+        task_frame.grid_columnconfigure(1, weight=1)
+        
+        # Task title (truncated if too long)
+        title = task.title if task.title else task.url
+        if len(title) > 50:
+            title = title[:47] + "..."
+        
+        task_label = self.theme_manager.create_themed_label(
+            task_frame,
+            text=title,
+            font_type="small"
+        )
+        task_label.grid(row=0, column=0, padx=(10, 5), pady=5, sticky="w")
+        
+        # Task progress bar
+        task_progress = ctk.CTkProgressBar(
+            task_frame, 
+            height=15,
+            progress_color=self._theme_cache["progress_fill"],
+            fg_color=self._theme_cache["progress_bg"]
+        )
+        task_progress.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
+        task_progress.set(task.progress / 100.0)
+        
+        # Task status label
+        task_status = self.theme_manager.create_themed_label(
+            task_frame,
+            text=task.status.value.upper(),
+            font_type="small"
+        )
+        task_status.grid(row=0, column=2, padx=(5, 10), pady=5, sticky="e")
+        
+        # Store references
+        widgets = _TaskWidgets(task_frame, task_progress, task_status, task_label)
+        self._individual_progress_bars[task.url] = widgets
+        return widgets
     
     def update_download_task(self, url: str, progress: float = None, status: DownloadStatus = None, title: str = None):
         """
@@ -320,86 +478,132 @@ class ProgressPanel(ctk.CTkFrame):
             status: New status
             title: New title
         """
+        # Skip updates that would leave the row as it is. Read without the
+        # lock; a stale read only costs one redundant update
+        shown = self._row_state.get(url)
+        if (shown is not None
+                and (progress is None or progress == shown[0])
+                and (status is None or status == shown[1])
+                and (title is None or title == shown[2])):
+            return
+        
         def _update_task():
             with self._lock:
                 if url not in self._download_tasks:
                     return
                 
                 task = self._download_tasks[url]
-                progress_bar_info = self._individual_progress_bars.get(url)
+                widgets = self._individual_progress_bars.get(url)
                 
-                if not progress_bar_info:
+                if widgets is None:
                     return
                 
-                # Update task object
-                if progress is not None:
+                # Update task object and only the widgets that change
+                shown_progress, shown_status, shown_title = self._row_state[url]
+                progress_changed = progress is not None and progress != shown_progress
+                if progress_changed:
                     task.update_progress(progress)
-                    progress_bar_info['progress'].set(progress / 100.0)
+                    self._progress_sum += progress - shown_progress
+                    shown_progress = progress
+                    widgets.progress.set(progress / 100.0)
                 
-                if status is not None:
+                if status is not None and status != shown_status:
                     task.set_status(status)
-                    progress_bar_info['status'].configure(text=status.value.upper())
+                    shown_status = status
+                    widgets.status.configure(text=status.value.upper())
                 
-                if title is not None:
+                if title is not None and title != shown_title:
                     task.title = title
+                    shown_title = title
                     display_title = title if len(title) <= 50 else title[:47] + "..."
-                    progress_bar_info['label'].configure(text=display_title)
+                    widgets.label.configure(text=display_title)
+                
+                self._row_state[url] = (shown_progress, shown_status, shown_title)
                 
                 # Update general progress
-                self._update_general_progress()
+                if progress_changed:
+                    self._update_general_progress()
         
-        # Ensure thread safety
-        try:
-            if threading.current_thread() != threading.main_thread():
-                self.after(0, _update_task)
-            else:
-                _update_task()
-        except RuntimeError:
-            # If we can't schedule the callback, just execute directly
-            # This can happen during testing when the main loop isn't running
-            _update_task()
+        self._run_on_ui_thread(_update_task)
     
     def _update_general_progress(self):
         """Calculate and update the general progress based on all tasks."""
+        # While draining queued callbacks, compute it once at the end
+        if self._coalesce_general_progress:
+            self._general_progress_dirty = True
+            return
+        self._general_progress_dirty = False
+        
         if not self._download_tasks:
             self.update_general_progress(0.0)
             return
         
-        total_progress = sum(task.progress for task in self._download_tasks.values())
-        average_progress = total_progress / len(self._download_tasks)
+        average_progress = self._progress_sum / len(self._download_tasks)
         self.update_general_progress(average_progress)
     
+    def remove_download_task(self, url: str):
+        """
+        Remove a download task and its individual progress bar.
+        
+        Args:
+            url: URL of the task to remove
+        """
+        def _remove():
+            with self._lock:
+                widgets = self._individual_progress_bars.pop(url, None)
+                if widgets is None:
+                    return
+                
+                self._download_tasks.pop(url, None)
+                shown = self._row_state.pop(url, None)
+                if shown is not None:
+                    self._progress_sum -= shown[0]
+                self._free_rows.append(self._task_rows.pop(url))
+                is_empty = not self._individual_progress_bars
+                if is_empty:
+                    self._free_rows.clear()
+            
+            # Tk calls happen outside the lock so progress callbacks aren't held up
+            widgets.frame.destroy()
+            if is_empty:
+                self.individual_title.grid_remove()
+                self.individual_scroll_frame.grid_remove()
+            self._update_general_progress()
+        
+        self._run_on_ui_thread(_remove)
+    
     def clear_all_tasks(self):
         """Clear all download tasks and reset the progress panel."""
         def _clear():
             with self._lock:
-                # Clear individual progress bars
-                for progress_info in self._individual_progress_bars.values():
-                    progress_info['frame'].destroy()
+                # Take the rows out of the shared state; destroy them below
+                rows = list(self._individual_progress_bars.values())
                 
                 self._individual_progress_bars.clear()
+                self._task_rows.clear()
+                self._free_rows.clear()
                 self._download_tasks.clear()
-                
-                # Hide individual progress section
-                self.individual_title.grid_remove()
-                self.individual_scroll_frame.grid_remove()
-                
-                # Reset general progress
-                self.update_general_progress(0.0)
-                
-                # Clear logs
-                self.log_text.delete("1.0", "end")
+                self._row_state.clear()
+                self._progress_sum = 0.0
+            
+            # Clear individual progress bars outside the lock
+            for widgets in rows:
+                widgets.frame.grid_remove()
+            for widgets in rows:
+                widgets.frame.destroy()
+            
+            # Hide individual progress section
+            self.individual_title.grid_remove()
+            self.individual_scroll_frame.grid_remove()
+            
+            # Reset general progress
+            self.update_general_progress(0.0)
+            
+            # Clear logs
+            self.log_text.delete("1.0", "end")
+            self._log_line_count = 0
         
-        # Ensure thread safety
-        try:
-            if threading.current_thread() != threading.main_thread():
-                self.after(0, _clear)
-            else:
-                _clear()
-        except RuntimeError:
-            # If we can't schedule the callback, just execute directly
-            # This can happen during testing when the main loop isn't running
-            _clear()
+        self._run_on_ui_thread(_clear)
     
     def get_download_tasks(self) -> Dict[str, DownloadTask]:
         """Get a copy of all current download tasks."""
@@ -414,9 +618,9 @@ class ProgressPanel(ctk.CTkFrame):
         """Log a warning message."""
         self.log_message(message, LogLevel.WARNING)
     
-    def log_error(self, message: str):
-        """Log an error message."""
-        self.log_message(message, LogLevel.ERROR)
+    def log_error(self, message: str, tip: Optional[str] = None):
+        """Log an error message, optionally followed by a tip line."""
+        self.log_message(message, LogLevel.ERROR, tip)
     
     def log_success(self, message: str):
         """Log a success message."""
@@ -424,38 +628,40 @@ class ProgressPanel(ctk.CTkFrame):
     
     def update_theme(self):
         """Update the progress panel theme when theme changes."""
+        self._refresh_theme_cache()
+        palette = self._theme_cache
+        
         # Update main frame colors
         self.configure(
-            fg_color=self.theme_manager.get_color("bg_secondary"),
-            border_color=self.theme_manager.get_color("border")
+            fg_color=palette["bg_secondary"],
+            border_color=palette["border"]
         )
         
         # Update progress bar colors
         if hasattr(self, 'general_progress_bar'):
             self.general_progress_bar.configure(
-                progress_color=self.theme_manager.get_color("progress_fill"),
-                fg_color=self.theme_manager.get_color("progress_bg")
+                progress_color=palette["progress_fill"],
+                fg_color=palette["progress_bg"]
             )
         
         # Update log text colors
         if hasattr(self, 'log_text'):
             self.log_text.configure(
-                fg_color=self.theme_manager.get_color("bg_tertiary"),
-                text_color=self.theme_manager.get_color("text_primary"),
-                border_color=self.theme_manager.get_color("border")
+                fg_color=palette["bg_tertiary"],
+                text_color=palette["text_primary"],
+                border_color=palette["border"]
             )
         
         # Update individual scroll frame colors
         if hasattr(self, 'individual_scroll_frame'):
             self.individual_scroll_frame.configure(
-                fg_color=self.theme_manager.get_color("bg_tertiary"),
-                border_color=self.theme_manager.get_color("border")
+                fg_color=palette["bg_tertiary"],
+                border_color=palette["border"]
             )
         
         # Update individual progress bars
-        for progress_info in self._individual_progress_bars.values():
-            if 'progress' in progress_info:
-                progress_info['progress'].configure(
-                    progress_color=self.theme_manager.get_color("progress_fill"),
-                    fg_color=self.theme_manager.get_color("progress_bg")
-                )
\ No newline at end of file
+        for widgets in self._individual_progress_bars.values():
+            widgets.progress.configure(
+                progress_color=palette["progress_fill"],
+                fg_color=palette["progress_bg"]
+            )
\ No newline at end of file
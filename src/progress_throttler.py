@@ -3,11 +3,17 @@ Progress throttling utility for optimizing UI updates.
 Prevents excessive progress callback spam that can slow down the UI.
 """
 import time
+import heapq
 import threading
-from typing import Dict, Any, Callable, Optional
+from typing import Dict, Any, Callable, List, Optional, Tuple
 from dataclasses import dataclass, field
 
 
+# Statuses delivered without waiting for the throttle interval
+_IMPORTANT_STATUSES = frozenset(('completed', 'failed', 'cancelled', 'converting'))
+_STATUS_DOWNLOADING = 'downloading'
+
+
 @dataclass
 class ThrottledProgress:
     """Container for throttled progress data."""
@@ -15,6 +21,7 @@ class ThrottledProgress:
     last_progress: float = 0.0
     pending_data: Optional[Dict[str, Any]] = None
     update_scheduled: bool = False
+    min_interval: Optional[float] = None  # Per-task override of the throttler default
 
 
 class ProgressThrottler:
@@ -49,15 +56,37 @@ class ProgressThrottler:
         self._progress_data: Dict[str, ThrottledProgress] = {}
         self._lock = threading.Lock()
         self._callback: Optional[Callable[[str, Dict[str, Any]], None]] = None
+        
+        # Delayed updates: a heap of (monotonic deadline, task_id) served by
+        # one timer thread, started on first use
+        self._timer_heap: List[Tuple[float, str]] = []
+        self._timer_cv = threading.Condition(self._lock)
+        self._timer_thread: Optional[threading.Thread] = None
     
     def set_callback(self, callback: Callable[[str, Dict[str, Any]], None]):
         """Set the callback function for throttled updates."""
         self._callback = callback
     
+    def set_interval(self, task_id: str, min_interval: float):
+        """
+        Override the minimum update interval for a single task.
+        
+        Args:
+            task_id: Unique identifier for the task
+            min_interval: Minimum time between updates in seconds for this task
+        """
+        with self._lock:
+            if task_id not in self._progress_data:
+                self._progress_data[task_id] = ThrottledProgress()
+            self._progress_data[task_id].min_interval = min_interval
+    
     def update_progress(self, task_id: str, progress_data: Dict[str, Any]):
         """
         Update progress for a task with throttling.
         
+        The dict is kept by reference until it is delivered, so callers must
+        not modify it after passing it in.
+        
         Args:
             task_id: Unique identifier for the task
             progress_data: Progress information dictionary
@@ -65,6 +94,18 @@ class ProgressThrottler:
         if not self._callback:
             return
         
+        # Fast path: a delayed update is already pending, so the latest data
+        # only needs to be stored for it. dict.get and the attribute store
+        # are atomic under the GIL. If the timer thread delivered in the
+        # meantime it has cleared update_scheduled first (see
+        # _perform_update), so re-checking the flag after the store tells
+        # whether this data is still covered; if not, take the slow path
+        throttled = self._progress_data.get(task_id)
+        if throttled is not None and throttled.update_scheduled:
+            throttled.pending_data = progress_data
+            if throttled.update_scheduled:
+                return
+        
         current_time = time.time()
         current_progress = progress_data.get('progress', 0.0)
         
@@ -75,8 +116,8 @@ class ProgressThrottler:
             
             throttled = self._progress_data[task_id]
             
-            # Store the latest data
-            throttled.pending_data = progress_data.copy()
+            # Keep the latest data
+            throttled.pending_data = progress_data
             
             # Check if we should update immediately
             should_update = self._should_update_immediately(
@@ -85,7 +126,7 @@ class ProgressThrottler:
             
             if should_update and not throttled.update_scheduled:
                 # Update immediately
-                self._perform_update(task_id, throttled, current_time, current_progress)
+                self._perform_update(task_id, throttled, current_time)
             elif not throttled.update_scheduled:
                 # Schedule a delayed update
                 self._schedule_delayed_update(task_id, throttled)
@@ -109,17 +150,13 @@ class ProgressThrottler:
         """
         time_since_last = current_time - throttled.last_update_time
         progress_change = abs(current_progress - throttled.last_progress)
+        min_interval = throttled.min_interval or self.min_interval
         
         # Check for important status changes that should update immediately
-        status_changed = False
         important_status = False
-        
         if throttled.pending_data:
-            current_status = throttled.pending_data.get('status', 'downloading')
-            # Important statuses that should update immediately
-            important_status = current_status in ['completed', 'failed', 'cancelled', 'converting']
-            # Any status change from downloading
-            status_changed = current_status != 'downloading'
+            current_status = throttled.pending_data.get('status', _STATUS_DOWNLOADING)
+            important_status = current_status in _IMPORTANT_STATUSES
         
         # Update immediately if:
         # 1. Important status change (completed, failed, etc.)
@@ -127,7 +164,7 @@ class ProgressThrottler:
         # 3. Too much time has passed (force update)
         return (
             important_status or
-            (time_since_last >= self.min_interval and progress_change >= self.min_progress_change) or
+            (time_since_last >= min_interval and progress_change >= self.min_progress_change) or
             time_since_last >= self.force_update_interval
         )
     
@@ -135,54 +172,67 @@ class ProgressThrottler:
         self, 
         task_id: str, 
         throttled: ThrottledProgress, 
-        current_time: float, 
-        current_progress: float
+        current_time: float
     ):
         """
-        Perform the actual progress update.
+        Perform the actual progress update. Caller holds the lock.
         
         Args:
             task_id: Task identifier
             throttled: Throttled progress data
             current_time: Current timestamp
-            current_progress: Current progress value
         """
         if throttled.pending_data and self._callback:
+            # Clear the flag before reading the data, so the lock-free path
+            # in update_progress never stores data after it was read here.
+            # The slot is read once: the delivered dict and the progress
+            # recorded for it must come from the same store
+            throttled.update_scheduled = False
+            data = throttled.pending_data
             try:
-                self._callback(task_id, throttled.pending_data)
+                self._callback(task_id, data)
                 throttled.last_update_time = current_time
-                throttled.last_progress = current_progress
-                throttled.update_scheduled = False
+                throttled.last_progress = data.get('progress', 0.0)
             except Exception as e:
                 print(f"Error in throttled progress callback: {e}")
     
     def _schedule_delayed_update(self, task_id: str, throttled: ThrottledProgress):
         """
-        Schedule a delayed update for the task.
+        Schedule a delayed update for the task. Caller holds the lock.
         
         Args:
             task_id: Task identifier
             throttled: Throttled progress data
         """
         throttled.update_scheduled = True
+        delay = throttled.min_interval or self.min_interval
         
-        def delayed_update():
-            time.sleep(self.min_interval)
-            
-            with self._lock:
-                if task_id in self._progress_data:
-                    current_throttled = self._progress_data[task_id]
-                    if current_throttled.update_scheduled and current_throttled.pending_data:
-                        current_progress = current_throttled.pending_data.get('progress', 0.0)
-                        self._perform_update(
-                            task_id, 
-                            current_throttled, 
-                            time.time(), 
-                            current_progress
-                        )
-        
-        # Run delayed update in a separate thread
-        threading.Thread(target=delayed_update, daemon=True).start()
+        heapq.heappush(self._timer_heap, (time.monotonic() + delay, task_id))
+        if self._timer_thread is None:
+            self._timer_thread = threading.Thread(
+                target=self._timer_loop, name="progress-throttler", daemon=True
+            )
+            self._timer_thread.start()
+        self._timer_cv.notify()
+    
+    def _timer_loop(self):
+        """Perform delayed updates as their deadlines come due."""
+        with self._timer_cv:
+            while True:
+                if not self._timer_heap:
+                    self._timer_cv.wait()
+                    continue
+                
+                deadline, task_id = self._timer_heap[0]
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    self._timer_cv.wait(remaining)
+                    continue
+                
+                heapq.heappop(self._timer_heap)
+                current_throttled = self._progress_data.get(task_id)
+                if current_throttled and current_throttled.update_scheduled:
+                    self._perform_update(task_id, current_throttled, time.time())
     
     def force_update(self, task_id: str):
         """
@@ -193,19 +243,14 @@ class ProgressThrottler:
         """
         with self._lock:
             if task_id in self._progress_data:
-                throttled = self._progress_data[task_id]
-                if throttled.pending_data:
-                    current_progress = throttled.pending_data.get('progress', 0.0)
-                    self._perform_update(task_id, throttled, time.time(), current_progress)
+                self._perform_update(task_id, self._progress_data[task_id], time.time())
     
     def force_update_all(self):
         """Force immediate updates for all tasks."""
         with self._lock:
-            for task_id in list(self._progress_data.keys()):
-                throttled = self._progress_data[task_id]
-                if throttled.pending_data:
-                    current_progress = throttled.pending_data.get('progress', 0.0)
-                    self._perform_update(task_id, throttled, time.time(), current_progress)
+            current_time = time.time()
+            for task_id, throttled in list(self._progress_data.items()):
+                self._perform_update(task_id, throttled, current_time)
     
     def clear_task(self, task_id: str):
         """
@@ -182,6 +182,19 @@ class ThemeManager:
         """
         return self._color_schemes[self._current_theme].get(color_key, "#FFFFFF")
     
+    def snapshot_palette(self) -> Dict[str, str]:
+        """
+        Get all colors of the current theme in one lookup.
+        
+        Use this when restyling several widgets at once instead of calling
+        get_color() for every option. The returned dict is shared with the
+        theme manager and must not be modified.
+        
+        Returns:
+            Dictionary mapping color keys to hex strings
+        """
+        return self._color_schemes[self._current_theme]
+    
     def get_font(self, font_key: str) -> ctk.CTkFont:
         """
         Get a font configuration.
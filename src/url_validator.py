@@ -6,11 +6,18 @@ multiple URLs from text input.
 """
 
 import re
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, Tuple
 from urllib.parse import urlparse, parse_qs
 import requests
 
 
+# Shared session so repeated accessibility checks reuse pooled connections
+_session = requests.Session()
+_session.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+})
+
+
 class URLValidator:
     """Validates YouTube URLs and extracts URLs from text."""
     
@@ -23,6 +30,19 @@ class URLValidator:
         r'^(?:https?://)?(?:m\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})(?:&.*)?$',
     ]
     
+    # Search patterns for finding URLs embedded in a line (without ^ and $ anchors)
+    SEARCH_PATTERNS = [
+        r'(?:https?://)?(?:www\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})(?:&[^\s]*)?',
+        r'(?:https?://)?(?:www\.)?youtu\.be/([a-zA-Z0-9_-]{11})(?:\?[^\s]*)?',
+        r'(?:https?://)?(?:www\.)?youtube\.com/embed/([a-zA-Z0-9_-]{11})(?:\?[^\s]*)?',
+        r'(?:https?://)?(?:www\.)?youtube\.com/v/([a-zA-Z0-9_-]{11})(?:\?[^\s]*)?',
+        r'(?:https?://)?(?:m\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})(?:&[^\s]*)?',
+    ]
+    
+    # Compiled once at import time and reused for every line/URL checked
+    _COMPILED_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in YOUTUBE_PATTERNS]
+    _COMPILED_SEARCH_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in SEARCH_PATTERNS]
+    
     @staticmethod
     def is_valid_youtube_url(url: str) -> bool:
         """
@@ -42,8 +62,8 @@ class URLValidator:
             return False
             
         # Check against all YouTube patterns
-        for pattern in URLValidator.YOUTUBE_PATTERNS:
-            if re.match(pattern, url, re.IGNORECASE):
+        for pattern in URLValidator._COMPILED_PATTERNS:
+            if pattern.match(url):
                 return True
                 
         return False
@@ -62,8 +82,8 @@ class URLValidator:
         if not URLValidator.is_valid_youtube_url(url):
             return ""
             
-        for pattern in URLValidator.YOUTUBE_PATTERNS:
-            match = re.match(pattern, url, re.IGNORECASE)
+        for pattern in URLValidator._COMPILED_PATTERNS:
+            match = pattern.match(url)
             if match:
                 return match.group(1)
                 
@@ -82,10 +102,34 @@ class URLValidator:
         """
         if not text or not isinstance(text, str):
             return []
+        
+        return URLValidator.extract_urls_from_lines(text.strip().split('\n'))
+    
+    @staticmethod
+    def extract_urls_from_lines(lines: Iterable[str]) -> List[str]:
+        """
+        Extract multiple YouTube URLs from already split lines of text.
+        
+        Args:
+            lines (Iterable[str]): Lines containing potential YouTube URLs
             
-        urls = []
-        lines = text.strip().split('\n')
+        Returns:
+            List[str]: List of valid YouTube URLs found, without duplicates
+        """
+        # Remove duplicates while preserving order
+        return list(dict.fromkeys(URLValidator._iter_line_urls(lines)))
+    
+    @staticmethod
+    def _iter_line_urls(lines: Iterable[str]) -> Iterator[str]:
+        """
+        Yield normalized YouTube URLs found in each line, in order.
         
+        Args:
+            lines (Iterable[str]): Lines containing potential YouTube URLs
+            
+        Yields:
+            str: Normalized YouTube URL
+        """
         for line in lines:
             line = line.strip()
             if not line:
@@ -94,33 +138,14 @@ class URLValidator:
             # Try to find URLs in the line
             # First check if the entire line is a URL
             if URLValidator.is_valid_youtube_url(line):
-                urls.append(URLValidator._normalize_url(line))
+                yield URLValidator._normalize_url(line)
             else:
                 # Look for URLs within the line using regex
-                # Create search patterns (without ^ and $ anchors)
-                search_patterns = [
-                    r'(?:https?://)?(?:www\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})(?:&[^\s]*)?',
-                    r'(?:https?://)?(?:www\.)?youtu\.be/([a-zA-Z0-9_-]{11})(?:\?[^\s]*)?',
-                    r'(?:https?://)?(?:www\.)?youtube\.com/embed/([a-zA-Z0-9_-]{11})(?:\?[^\s]*)?',
-                    r'(?:https?://)?(?:www\.)?youtube\.com/v/([a-zA-Z0-9_-]{11})(?:\?[^\s]*)?',
-                    r'(?:https?://)?(?:m\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})(?:&[^\s]*)?',
-                ]
-                for pattern in search_patterns:
-                    matches = re.finditer(pattern, line, re.IGNORECASE)
-                    for match in matches:
+                for pattern in URLValidator._COMPILED_SEARCH_PATTERNS:
+                    for match in pattern.finditer(line):
                         full_url = match.group(0)
                         if URLValidator.is_valid_youtube_url(full_url):
-                            urls.append(URLValidator._normalize_url(full_url))
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_urls = []
-        for url in urls:
-            if url not in seen:
-                seen.add(url)
-                unique_urls.append(url)
-                
-        return unique_urls
+                            yield URLValidator._normalize_url(full_url)
     
     @staticmethod
     def _normalize_url(url: str) -> str:
@@ -158,11 +183,7 @@ class URLValidator:
             normalized_url = URLValidator._normalize_url(url)
             
             # Make a HEAD request to check if the video exists
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            response = requests.head(normalized_url, headers=headers, timeout=timeout, allow_redirects=True)
+            response = _session.head(normalized_url, timeout=timeout, allow_redirects=True)
             
             if response.status_code == 200:
                 return True, ""
@@ -2,6 +2,7 @@
 YouTube downloader service with progress callbacks and error handling.
 """
 import os
+import threading
 import yt_dlp
 from typing import List, Callable, Optional
 from .ffmpeg_service import FFmpegService
@@ -28,12 +29,47 @@ class YouTubeDownloader:
         self.download_folder = download_folder
         self._ffmpeg_path = ffmpeg_path
         self._cancel_requested = False
+        
+        # One YoutubeDL per worker thread, reused across downloads so its
+        # HTTP session keeps pooled connections to YouTube's hosts
+        self._local = threading.local()
+        self._ydl_instances: List[yt_dlp.YoutubeDL] = []
+        self._ydl_lock = threading.Lock()
+        
         self._ensure_download_folder()
     
     def request_cancellation(self):
         """Request cancellation of current download."""
         self._cancel_requested = True
     
+    def close(self):
+        """Close all cached YoutubeDL instances and their network connections."""
+        with self._ydl_lock:
+            instances = self._ydl_instances
+            self._ydl_instances = []
+        for ydl in instances:
+            try:
+                ydl.close()
+            except Exception:
+                pass
+        self._local = threading.local()
+    
+    def _get_thread_ydl(self) -> yt_dlp.YoutubeDL:
+        """Get (or lazily create) the YoutubeDL instance owned by the calling thread."""
+        ydl = getattr(self._local, 'ydl', None)
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL(self._get_ydl_opts(self._dispatch_progress))
+            self._local.ydl = ydl
+            with self._ydl_lock:
+                self._ydl_instances.append(ydl)
+        return ydl
+    
+    def _dispatch_progress(self, d: dict):
+        """Forward yt-dlp progress to the hook of the download running on this thread."""
+        hook = getattr(self._local, 'progress_hook', None)
+        if hook is not None:
+            hook(d)
+    
     def _ensure_download_folder(self):
         """Create download folder if it doesn't exist."""
         try:
@@ -162,10 +198,12 @@ class YouTubeDownloader:
                         'filename': d.get('filename', '')
                     })
             
-            ydl_opts = self._get_ydl_opts(progress_hook)
-            
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            ydl = self._get_thread_ydl()
+            self._local.progress_hook = progress_hook
+            try:
                 ydl.download([url])
+            finally:
+                self._local.progress_hook = None
             
             # Final check for cancellation
             if cancel_event and cancel_event.is_set():